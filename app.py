@@ -16,8 +16,6 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import time
 import sys
@@ -556,6 +554,7 @@ def detect_device_and_layout():
         if st.session_state.get('trigger_calculation', False):
             # 清除觸發標記
             st.session_state.trigger_calculation = False
+            st.session_state._calc_in_flight = False
             
             # 執行計算流程
             calculation_results = simplified_calculation_flow(user_params)
@@ -8,8 +8,6 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import logging
@@ -229,6 +227,7 @@ def render_main_content() -> None:
             
         # 重置觸發標誌
         st.session_state.trigger_calculation = False
+        st.session_state._calc_in_flight = False
     
     # 如果有之前的計算結果，顯示它們
     elif 'calculation_results' in st.session_state:
@@ -543,6 +542,8 @@ def _display_welcome_message():
 
 def _display_growth_chart(results: Dict[str, Any]):
     """顯示成長趨勢圖表"""
+    import plotly.graph_objects as go
+    
     st.subheader("📈 投資組合成長趨勢")
     
     va_data = results.get('va_strategy', {})
@@ -4,13 +4,37 @@
 """
 
 import streamlit as st
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 import sys
 
-# 添加src目錄到Python路徑
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+# 圖表相依套件於載入時匯入一次
+try:
+    import plotly.express as _px
+    import pandas as _pd
+    _HAS_PLOTLY = True
+except ImportError:
+    _HAS_PLOTLY = False
+
+# 添加src目錄到Python路徑（重複匯入時不重複加入）
+_SRC_DIR = os.path.join(os.path.dirname(__file__), '..')
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
+
+# 局部重跑裝飾器：st.fragment（1.37+），舊版退回 experimental_fragment，再不支援則直接執行
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# 投資頻率 → 每年期數 / 顯示名稱（唯讀共用）
+_FREQUENCY_MAP = MappingProxyType({"monthly": 12, "quarterly": 4, "semi_annually": 2, "annually": 1})
+_FREQUENCY_LABELS = MappingProxyType({"monthly": "每月", "quarterly": "每季", "semi_annually": "每半年", "annually": "每年"})
+
+# 移動端預設設備配置（與 ResponsiveDesignManager.get_optimized_parameters 的mobile設定一致）
+_DEFAULT_DEVICE_CONFIG = MappingProxyType({"step_size": 1000, "decimal_places": 0, "show_advanced": False})
 
 # 3.2.1 參數設定實作 - PARAMETERS 字典
 PARAMETERS = {
@@ -251,6 +275,16 @@ PARAMETERS = {
     }
 }
 
+# 投資頻率radio選項（由PARAMETERS衍生，載入時建立一次）
+_FREQ_OPTION_LABELS = tuple(
+    f"{opt['icon']} {opt['label']}" for opt in PARAMETERS["investment_frequency"]["options"]
+)
+_FREQ_OPTION_VALUES = tuple(opt['value'] for opt in PARAMETERS["investment_frequency"]["options"])
+_FREQ_VALUE_TO_IDX = {value: i for i, value in enumerate(_FREQ_OPTION_VALUES)}
+
+# VA成長率滑桿顯示格式（依display_precision預先組合）
+_VA_GROWTH_FMT = f"%.{PARAMETERS['va_growth_rate']['display_precision']}f%%"
+
 # 3.2.2 進階設定實作 - ADVANCED_SETTINGS
 ADVANCED_SETTINGS = {
     "expandable_section": {
@@ -364,13 +398,310 @@ ADVANCED_SETTINGS = {
     }
 }
 
+@dataclass(frozen=True)
+class ParamSchema:
+    """參數設定的不可變視圖 - 渲染時以屬性存取取代多層字典索引"""
+    label: str
+    help: str = ""
+    range: Tuple = ()
+    step: Any = None
+    default: Any = None
+    precision: Optional[int] = None
+    display_precision: Optional[int] = None
+    options: Tuple[Mapping[str, Any], ...] = ()
+    option_labels: Tuple[str, ...] = ()
+    option_values: Tuple[Any, ...] = ()
+    chapter2_integration: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+def _build_param_schema(config: Dict[str, Any]) -> ParamSchema:
+    """將PARAMETERS字典中的單一參數設定轉換為ParamSchema（含預先組合的選項顯示字串）"""
+    options = config.get("options", ())
+    return ParamSchema(
+        label=config["label"],
+        help=config.get("help", ""),
+        range=tuple(config.get("range", ())),
+        step=config.get("step"),
+        default=config.get("default"),
+        precision=config.get("precision"),
+        display_precision=config.get("display_precision"),
+        options=tuple(MappingProxyType(opt) for opt in options),
+        option_labels=tuple(f"{opt['icon']} {opt['label']}" for opt in options),
+        option_values=tuple(opt['value'] for opt in options),
+        chapter2_integration=MappingProxyType(config.get("chapter2_integration", {}))
+    )
+
+@lru_cache(maxsize=64)
+def _periods_for(investment_years: int, frequency: str) -> Tuple[int, int]:
+    """依投資年數與頻率計算 (總期數, 每年期數)"""
+    periods_per_year = _FREQUENCY_MAP.get(frequency, 1)
+    return investment_years * periods_per_year, periods_per_year
+
+@lru_cache(maxsize=4)
+def _format_calculation_time(timestamp: datetime) -> str:
+    """格式化上次計算時間 - 相同時間戳只格式化一次"""
+    return timestamp.strftime('%Y-%m-%d %H:%M:%S')
+
+@lru_cache(maxsize=64, typed=True)
+def _format_currency(value: int) -> str:
+    """格式化貨幣金額，例如 $10,000"""
+    return f"${value:,}"
+
+@lru_cache(maxsize=64, typed=True)
+def _format_percentage(value: float) -> str:
+    """格式化百分比，例如 13%（typed=True：20與20.0分開快取，避免顯示成另一型別的格式）"""
+    return f"{value}%"
+
+@st.cache_data(max_entries=32)
+def _build_allocation_pie_figure(stock_ratio: int, bond_ratio: int):
+    """建立股債配置圓餅圖 - 依(股票, 債券)比例快取（僅在 _HAS_PLOTLY 時呼叫）"""
+    # 準備圓餅圖數據
+    data = {
+        'asset_type': ['股票', '債券'],
+        'percentage': [stock_ratio, bond_ratio],
+        'colors': ['#3b82f6', '#f59e0b']
+    }
+    
+    df = _pd.DataFrame(data)
+    
+    # 創建圓餅圖
+    fig = _px.pie(
+        df, 
+        values='percentage', 
+        names='asset_type',
+        title="📊 投資組合配置",
+        color_discrete_sequence=['#3b82f6', '#f59e0b']
+    )
+    
+    # 優化圖表設定
+    fig.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate='<b>%{label}</b><br>比例: %{percent}<br>數值: %{value}%<extra></extra>'
+    )
+    
+    fig.update_layout(
+        showlegend=True,
+        height=300,
+        margin=dict(t=50, b=50, l=50, r=50)
+    )
+    
+    return fig
+
+def _build_tech_info_markdown(params: Dict[str, Any]) -> Dict[str, str]:
+    """預先組合各參數「技術整合資訊」區塊的Markdown內容"""
+    rate_config = params["inflation_adjustment"]["inflation_rate"]
+    va_param = params["va_growth_rate"]
+    
+    return {
+        "initial_investment": _integration_markdown(
+            ("第1章數據源整合", params["initial_investment"]["chapter1_integration"]),
+            ("第2章計算邏輯整合", params["initial_investment"]["chapter2_integration"])
+        ),
+        "annual_investment": _integration_markdown(
+            ("第2章計算邏輯整合", params["annual_investment"]["chapter2_integration"])
+        ),
+        "investment_start_date": _integration_markdown(
+            ("第1章時間軸生成集成", params["investment_start_date"]["chapter1_integration"]),
+            ("第2章計算邏輯集成", params["investment_start_date"]["chapter2_integration"])
+        ),
+        "investment_years": _integration_markdown(
+            ("第1章時間軸整合", params["investment_years"]["chapter1_integration"]),
+            ("第2章期數計算整合", params["investment_years"]["chapter2_integration"])
+        ),
+        "investment_frequency": _integration_markdown(
+            ("第1章交易日整合", params["investment_frequency"]["chapter1_integration"]),
+            ("第2章參數轉換整合", params["investment_frequency"]["chapter2_integration"])
+        ),
+        "stock_percentage": _integration_markdown(
+            ("第1章數據源整合", params["stock_percentage"]["chapter1_integration"]),
+            ("第2章計算邏輯整合", params["stock_percentage"]["chapter2_integration"])
+        ),
+        "va_growth_rate": _integration_markdown(
+            ("第2章VA公式核心整合", {
+                **va_param["chapter2_integration"],
+                "內部精度": f"{va_param['precision']} 位小數",
+                "顯示精度": f"{va_param['display_precision']} 位小數"
+            })
+        ),
+        "strategy_type": _integration_markdown(
+            ("第2章VA策略執行邏輯整合", params["strategy_type"]["chapter2_integration"])
+        ),
+        "inflation_adjustment": _integration_markdown(
+            ("第2章DCA投入公式整合", rate_config["chapter2_integration"])
+        ),
+        "data_source": _integration_markdown(
+            ("第1章數據源完整整合", params["data_source"]["chapter1_integration"])
+        )
+    }
+
+def _build_param_schemas(params: Dict[str, Any]) -> Dict[str, ParamSchema]:
+    """建立渲染用的ParamSchema對照表"""
+    schema = {
+        name: _build_param_schema(params[name])
+        for name in (
+            "initial_investment", "annual_investment", "investment_start_date",
+            "investment_years", "investment_frequency", "stock_percentage",
+            "va_growth_rate", "strategy_type"
+        )
+    }
+    schema["inflation_toggle"] = _build_param_schema(params["inflation_adjustment"]["enable_toggle"])
+    schema["inflation_rate"] = _build_param_schema(params["inflation_adjustment"]["inflation_rate"])
+    return schema
+
+@st.cache_resource
+def _get_param_config() -> Dict[str, Any]:
+    """靜態參數設定與其衍生結構 - 整個程序只建立一次，所有會話共用"""
+    return {
+        "basic": PARAMETERS,
+        "advanced": ADVANCED_SETTINGS,
+        "schema": _build_param_schemas(PARAMETERS),
+        "tech_md": _build_tech_info_markdown(PARAMETERS)
+    }
+
+@st.cache_data(max_entries=64)
+def _validate_parameter_values(initial_investment: int, investment_years: int,
+                               va_growth_rate: float, stock_ratio: int) -> Dict[str, Any]:
+    """驗證參數數值 - 依參數組合快取結果"""
+    validation_result = {
+        "is_valid": True,
+        "errors": [],
+        "warnings": []
+    }
+    
+    # 基本參數驗證
+    if initial_investment < 0:
+        validation_result["errors"].append("期初投入金額不能為負數")
+        validation_result["is_valid"] = False
+    
+    if investment_years < 5:
+        validation_result["errors"].append("投資年數不能少於5年")
+        validation_result["is_valid"] = False
+    
+    # 進階參數驗證
+    if va_growth_rate < -20 or va_growth_rate > 50:
+        validation_result["errors"].append("VA成長率超出合理範圍(-20%到50%)")
+        validation_result["is_valid"] = False
+    
+    # 警告檢查
+    if va_growth_rate > 30:
+        validation_result["warnings"].append("高成長率可能不符合實際市場情況")
+    
+    if stock_ratio > 90:
+        validation_result["warnings"].append("股票比例過高可能增加投資風險")
+    
+    return validation_result
+
+def _lookup_api_key(key_name: str) -> Optional[str]:
+    """獲取API金鑰 - 多層級策略"""
+    # 第1層：Streamlit Secrets
+    try:
+        if hasattr(st, 'secrets') and key_name in st.secrets:
+            return st.secrets[key_name]
+    except:
+        pass
+    
+    # 第2層：環境變數
+    return os.environ.get(key_name)
+
+@st.cache_data(ttl=300)
+def _cached_api_key_presence() -> Tuple[bool, bool]:
+    """檢查(Tiingo, FRED)金鑰是否存在 - 快取5分鐘，只保存布林值不保存金鑰本身"""
+    return (
+        bool(_lookup_api_key('TIINGO_API_KEY')),
+        bool(_lookup_api_key('FRED_API_KEY'))
+    )
+
+def _sync_linked_inputs(state_key: str, source_key: str, mirror_key: str):
+    """on_change回呼 - 將變動元件的數值寫回參數狀態並鏡像到另一個元件"""
+    value = st.session_state[source_key]
+    st.session_state[state_key] = value
+    st.session_state[mirror_key] = value
+
+def _summary_markdown_table(summary_values) -> str:
+    """將(標籤, 數值)組合成兩欄並排的Markdown表格"""
+    half = (len(summary_values) + 1) // 2
+    rows = ["| 項目 | 數值 | 項目 | 數值 |", "| --- | --- | --- | --- |"]
+    for (left_label, left_value), (right_label, right_value) in zip(summary_values[:half], summary_values[half:]):
+        rows.append(f"| {left_label} | **{left_value}** | {right_label} | **{right_value}** |")
+    return "\n".join(rows)
+
+def _integration_markdown(*sections) -> str:
+    """將(標題, 整合資訊字典)組合成單一Markdown字串"""
+    lines = []
+    for title, integration in sections:
+        lines.append(f"**{title}**")
+        for key, value in integration.items():
+            if isinstance(value, list):
+                value = ', '.join(value)
+            lines.append(f"• **{key}**: {value}")
+    return "\n\n".join(lines)
+
 class ParameterManager:
     """參數管理器 - 實作第3章3.2節所有規格"""
     
+    # 移動端簡化頻率選項（靜態設定，避免每次重跑重建）
+    _MOBILE_FREQ_KEYS = ("monthly", "quarterly", "annually")
+    _MOBILE_FREQ_LABELS = {
+        "monthly": "📅 每月",
+        "quarterly": "📅 每季",
+        "annually": "📅 每年"
+    }
+    _MOBILE_FREQ_INDEX = {key: i for i, key in enumerate(_MOBILE_FREQ_KEYS)}
+    
+    # API金鑰設定指引（單一Markdown區塊，渲染時僅填入缺少的金鑰）
+    _API_KEY_GUIDE_MD = """**缺少API金鑰**: {missing}
+
+**🎯 不用擔心！系統會自動處理：**
+
+• 🔄 自動切換到高品質模擬數據  
+• 📊 所有功能正常運作  
+• 🎲 基於真實歷史統計的模擬
+
+**🔑 如需使用真實數據，請設定API金鑰：**
+
+1. **Tiingo API** (股票數據) - [免費註冊](https://api.tiingo.com/)
+2. **FRED API** (債券數據) - [免費註冊](https://fred.stlouisfed.org/docs/api/api_key.html)
+
+**📋 Streamlit Cloud設定步驟：**
+
+1. 點擊右下角 'Manage app'
+2. 進入 'Secrets' 設定
+3. 添加："""
+    _API_KEY_SECRETS_TOML = '''TIINGO_API_KEY = "your_tiingo_key_here"
+FRED_API_KEY = "your_fred_key_here"'''
+    
     def __init__(self):
-        self.basic_params = PARAMETERS
-        self.advanced_settings = ADVANCED_SETTINGS
+        config = _get_param_config()
+        self.basic_params = config["basic"]
+        self.advanced_settings = config["advanced"]
         self.current_values = {}
+        
+        # 渲染用的不可變參數視圖（跨會話共用）
+        self._schema = config["schema"]
+        
+        # 選項值→索引對照表（取代每次渲染的 list.index 查找）
+        self._strategy_value_to_idx = {
+            opt['value']: i for i, opt in enumerate(self.basic_params["strategy_type"]["options"])
+        }
+        
+        # 數據來源選項依priority排序一次，並預先產生標籤
+        self._data_source_options = tuple(sorted(
+            self.basic_params["data_source"]["user_options"]["options"],
+            key=itemgetter('priority')
+        ))
+        self._data_source_labels = tuple(
+            f"{opt['icon']} {opt['label']}" for opt in self._data_source_options
+        )
+        self._datasource_value_to_idx = {
+            opt['value']: i for i, opt in enumerate(self._data_source_options)
+        }
+        self._data_source_default_index = self._datasource_value_to_idx.get(
+            self.basic_params["data_source"]["default_mode"], 0
+        )
+        
+        # 技術整合資訊Markdown（設定為靜態，跨會話共用）
+        self._tech_md = config["tech_md"]
+        
         self._initialize_session_state()
     
     def _initialize_session_state(self):
@@ -384,7 +715,6 @@ class ParameterManager:
         
         if 'investment_start_date' not in st.session_state:
             # 預設為1994年1月1日
-            from datetime import datetime
             st.session_state.investment_start_date = datetime(1994, 1, 1).date()
         
         if 'investment_years' not in st.session_state:
@@ -417,6 +747,9 @@ class ParameterManager:
         """渲染參數設定區域 - 永遠可見"""
         st.header("🎯 參數設定")
         
+        # 單一開關控制所有技術整合資訊區塊，關閉時不送出任何相關元素
+        st.toggle("🔧 顯示技術整合資訊", key="show_tech_info")
+        
         # 按照指定順序排列參數：
         # 1. 期初投入金額
         self._render_initial_investment()
@@ -448,120 +781,85 @@ class ParameterManager:
         # 10. VA策略類型
         self._render_strategy_type()
     
+    def _render_tech_info(self, name: str):
+        """渲染技術整合資訊 - 僅在面板開關開啟時輸出"""
+        if st.session_state.get("show_tech_info"):
+            st.markdown(self._tech_md[name])
+    
     def _render_initial_investment(self):
         """渲染期初投入金額參數 - 嚴格按照規格"""
-        param = self.basic_params["initial_investment"]
+        param = self._schema["initial_investment"]
         
         # 使用number_input實現slider_with_input效果
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            # 主要滑桿
-            investment_amount = st.slider(
-                param["label"],
-                min_value=param["range"][0],
-                max_value=param["range"][1],
-                value=st.session_state.initial_investment,
-                step=param["step"],
-                format="$%d",
-                help=param["help"],
-                key="initial_investment_slider"
-            )
-        
-        with col2:
-            # 輔助數字輸入
-            investment_input = st.number_input(
-                "精確輸入",
-                min_value=param["range"][0],
-                max_value=param["range"][1],
-                value=investment_amount,
-                step=param["step"],
-                format="%d",
-                key="initial_investment_input"
-            )
-        
-        # 同步兩個輸入
-        if investment_amount != investment_input:
-            st.session_state.initial_investment = investment_input
-            st.rerun()
-        else:
-            st.session_state.initial_investment = investment_amount
+        self._render_linked_amount_inputs(param, "initial_investment")
         
         # 顯示第1章和第2章整合資訊
-        if st.checkbox("🔧 顯示技術整合資訊", key="show_initial_investment_tech_info"):
-            st.markdown("**第1章數據源整合**")
-            ch1_integration = param['chapter1_integration']
-            for key, value in ch1_integration.items():
-                st.markdown(f"• **{key}**: {value}")
-            
-            st.markdown("**第2章計算邏輯整合**")
-            ch2_integration = param['chapter2_integration']
-            for key, value in ch2_integration.items():
-                if isinstance(value, list):
-                    st.markdown(f"• **{key}**: {', '.join(value)}")
-                else:
-                    st.markdown(f"• **{key}**: {value}")
+        self._render_tech_info("initial_investment")
     
     def _render_annual_investment(self):
         """渲染年度投入金額參數 - 嚴格按照規格"""
-        param = self.basic_params["annual_investment"]
+        param = self._schema["annual_investment"]
         
         # 使用number_input實現slider_with_input效果
+        self._render_linked_amount_inputs(param, "annual_investment")
+        
+        # 顯示期間投入金額預覽
+        periods_per_year = _FREQUENCY_MAP.get(st.session_state.investment_frequency, 1)
+        period_amount = st.session_state.annual_investment / periods_per_year
+        frequency_label = _FREQUENCY_LABELS.get(st.session_state.investment_frequency, "每年")
+        
+        st.info(f"📊 {frequency_label}投入金額: ${period_amount:,.0f}")
+        
+        # 顯示第2章整合資訊
+        self._render_tech_info("annual_investment")
+    
+    def _render_linked_amount_inputs(self, param: ParamSchema, state_key: str):
+        """
+        渲染互相連動的金額滑桿與精確輸入框
+        兩個元件透過on_change回呼同步，不需額外st.rerun()
+        """
+        slider_key = f"{state_key}_slider"
+        input_key = f"{state_key}_input"
+        
+        # 外部來源（預設方案、移動端表單）修改數值時，先同步兩個元件
+        value = st.session_state[state_key]
+        if st.session_state.get(slider_key) != value:
+            st.session_state[slider_key] = value
+        if st.session_state.get(input_key) != value:
+            st.session_state[input_key] = value
+        
         col1, col2 = st.columns([3, 1])
         
         with col1:
             # 主要滑桿
-            annual_amount = st.slider(
-                param["label"],
-                min_value=param["range"][0],
-                max_value=param["range"][1],
-                value=st.session_state.annual_investment,
-                step=param["step"],
+            st.slider(
+                param.label,
+                min_value=param.range[0],
+                max_value=param.range[1],
+                step=param.step,
                 format="$%d",
-                help=param["help"],
-                key="annual_investment_slider"
+                help=param.help,
+                key=slider_key,
+                on_change=_sync_linked_inputs,
+                args=(state_key, slider_key, input_key)
             )
         
         with col2:
             # 輔助數字輸入
-            annual_input = st.number_input(
+            st.number_input(
                 "精確輸入",
-                min_value=param["range"][0],
-                max_value=param["range"][1],
-                value=annual_amount,
-                step=param["step"],
+                min_value=param.range[0],
+                max_value=param.range[1],
+                step=param.step,
                 format="%d",
-                key="annual_investment_input"
+                key=input_key,
+                on_change=_sync_linked_inputs,
+                args=(state_key, input_key, slider_key)
             )
-        
-        # 同步兩個輸入
-        if annual_amount != annual_input:
-            st.session_state.annual_investment = annual_input
-            st.rerun()
-        else:
-            st.session_state.annual_investment = annual_amount
-        
-        # 顯示期間投入金額預覽
-        frequency_map = {"monthly": 12, "quarterly": 4, "semi_annually": 2, "annually": 1}
-        periods_per_year = frequency_map.get(st.session_state.investment_frequency, 1)
-        period_amount = st.session_state.annual_investment / periods_per_year
-        frequency_labels = {"monthly": "每月", "quarterly": "每季", "semi_annually": "每半年", "annually": "每年"}
-        frequency_label = frequency_labels.get(st.session_state.investment_frequency, "每年")
-        
-        st.info(f"📊 {frequency_label}投入金額: ${period_amount:,.0f}")
-        
-        # 顯示第2章整合資訊
-        if st.checkbox("🔧 顯示技術整合資訊", key="show_annual_investment_tech_info"):
-            st.markdown("**第2章計算邏輯整合**")
-            ch2_integration = param['chapter2_integration']
-            for key, value in ch2_integration.items():
-                st.markdown(f"• **{key}**: {value}")
     
     def _render_investment_start_date(self):
         """渲染投資起始日期參數 - 嚴格按照規格"""
-        param = self.basic_params["investment_start_date"]
-        
-        from datetime import datetime, timedelta
+        param = self._schema["investment_start_date"]
         
         # 確保session state已初始化 - 修正：防護機制
         if 'investment_start_date' not in st.session_state:
@@ -574,10 +872,10 @@ class ParameterManager:
         
         # 主要日期選擇器
         selected_date = st.date_input(
-            param["label"],
+            param.label,
             min_value=min_date,
             max_value=max_date,
-            help=param["help"],
+            help=param.help,
             key="investment_start_date"
         )
         
@@ -588,9 +886,8 @@ class ParameterManager:
             # 檢查是否為交易日
             try:
                 from src.utils.trading_days import is_trading_day, adjust_for_trading_days
-                from datetime import datetime as dt
                 
-                selected_datetime = dt.combine(selected_date, dt.min.time())
+                selected_datetime = datetime.combine(selected_date, datetime.min.time())
                 
                 if is_trading_day(selected_datetime):
                     st.success(f"✅ {selected_date} 是交易日")
@@ -606,25 +903,15 @@ class ParameterManager:
                 self._show_timeline_preview(selected_date)
         
         # 顯示第1章和第2章整合資訊
-        if st.checkbox("🔧 顯示技術整合資訊", key="show_start_date_tech_info"):
-            st.markdown("**第1章時間軸生成集成**")
-            ch1_integration = param['chapter1_integration']
-            for key, value in ch1_integration.items():
-                st.markdown(f"• **{key}**: {value}")
-            
-            st.markdown("**第2章計算邏輯集成**")
-            ch2_integration = param['chapter2_integration']
-            for key, value in ch2_integration.items():
-                st.markdown(f"• **{key}**: {value}")
+        self._render_tech_info("investment_start_date")
     
     def _show_timeline_preview(self, start_date):
         """顯示時間軸預覽"""
         try:
             from src.utils.trading_days import generate_simulation_timeline
-            from datetime import datetime as dt
             
             # 生成預覽時間軸（只顯示前4期）
-            start_datetime = dt.combine(start_date, dt.min.time())
+            start_datetime = datetime.combine(start_date, datetime.min.time())
             preview_timeline = generate_simulation_timeline(
                 investment_years=1,  # 只預覽1年
                 frequency=st.session_state.get('investment_frequency', 'quarterly'),
@@ -644,68 +931,52 @@ class ParameterManager:
     
     def _render_investment_years(self):
         """渲染投資年數參數 - 嚴格按照規格"""
-        param = self.basic_params["investment_years"]
+        param = self._schema["investment_years"]
         
         years = st.slider(
-            param["label"],
-            min_value=param["range"][0],
-            max_value=param["range"][1],
-            step=param["step"],
-            help=param["help"],
+            param.label,
+            min_value=param.range[0],
+            max_value=param.range[1],
+            step=param.step,
+            help=param.help,
             key="investment_years"
         )
         
         # 顯示計算的總期數
-        frequency_map = {"monthly": 12, "quarterly": 4, "semi_annually": 2, "annually": 1}
-        periods_per_year = frequency_map.get(st.session_state.investment_frequency, 1)
+        periods_per_year = _FREQUENCY_MAP.get(st.session_state.investment_frequency, 1)
         total_periods = years * periods_per_year
         
         st.info(f"📊 總投資期數: {total_periods} 期 ({years} 年 × {periods_per_year} 期/年)")
         
         # 顯示第1章和第2章整合資訊
-        if st.checkbox("🔧 顯示技術整合資訊", key="show_investment_years_tech_info"):
-            st.markdown("**第1章時間軸整合**")
-            ch1_integration = param['chapter1_integration']
-            for key, value in ch1_integration.items():
-                st.markdown(f"• **{key}**: {value}")
-            
-            st.markdown("**第2章期數計算整合**")
-            ch2_integration = param['chapter2_integration']
-            for key, value in ch2_integration.items():
-                if isinstance(value, list):
-                    st.markdown(f"• **{key}**: {', '.join(value)}")
-                else:
-                    st.markdown(f"• **{key}**: {value}")
+        self._render_tech_info("investment_years")
     
     def _render_investment_frequency(self):
         """渲染投資頻率參數 - 嚴格按照規格"""
-        param = self.basic_params["investment_frequency"]
+        param = self._schema["investment_frequency"]
         
-        # 創建選項標籤
-        options = param["options"]
-        option_labels = [f"{opt['icon']} {opt['label']}" for opt in options]
-        option_values = [opt['value'] for opt in options]
+        # 選項標籤與索引已於模組載入時建立
+        options = param.options
         
         # 找到當前值的索引
-        current_index = 0
-        try:
-            current_index = option_values.index(st.session_state.investment_frequency)
-        except ValueError:
-            current_index = option_values.index(param["default"])
+        current_index = _FREQ_VALUE_TO_IDX.get(
+            st.session_state.investment_frequency,
+            _FREQ_VALUE_TO_IDX[param.default]
+        )
         
         # 渲染radio buttons
         selected_index = st.radio(
-            param["label"],
+            param.label,
             range(len(options)),
             index=current_index,
-            format_func=lambda x: option_labels[x],
+            format_func=_FREQ_OPTION_LABELS.__getitem__,
             horizontal=True,
-            help=param["help"],
+            help=param.help,
             key="investment_frequency_radio"
         )
         
         # 獲取選中的值（不直接修改session state）
-        selected_frequency = option_values[selected_index]
+        selected_frequency = _FREQ_OPTION_VALUES[selected_index]
         
         # 顯示頻率說明
         selected_option = options[selected_index]
@@ -716,33 +987,22 @@ class ParameterManager:
             st.session_state.investment_frequency = selected_frequency
         
         # 顯示第1章和第2章整合資訊
-        if st.checkbox("🔧 顯示技術整合資訊", key="show_frequency_tech_info"):
-            st.markdown("**第1章交易日整合**")
-            ch1_integration = param['chapter1_integration']
-            for key, value in ch1_integration.items():
-                st.markdown(f"• **{key}**: {value}")
-            
-            st.markdown("**第2章參數轉換整合**")
-            ch2_integration = param['chapter2_integration']
-            for key, value in ch2_integration.items():
-                if isinstance(value, list):
-                    st.markdown(f"• **{key}**: {', '.join(value)}")
-                else:
-                    st.markdown(f"• **{key}**: {value}")
+        self._render_tech_info("investment_frequency")
     
+    @_fragment
     def _render_stock_percentage(self):
         """渲染股票比例參數 - 債券比例自動計算"""
-        param = self.basic_params["stock_percentage"]
+        param = self._schema["stock_percentage"]
         
         # 股票比例滑桿
         stock_ratio = st.slider(
-            param["label"],
-            min_value=param["range"][0],
-            max_value=param["range"][1],
+            param.label,
+            min_value=param.range[0],
+            max_value=param.range[1],
             value=st.session_state.stock_ratio,
-            step=param["step"],
+            step=param.step,
             format="%d%%",
-            help=param["help"],
+            help=param.help,
             key="stock_ratio_slider"
         )
         
@@ -757,57 +1017,14 @@ class ParameterManager:
         st.info(f"📊 投資組合配置: {stock_ratio}% 股票 + {bond_ratio}% 債券")
         
         # 顯示第1章和第2章整合資訊
-        if st.checkbox("🔧 顯示技術整合資訊", key="show_stock_percentage_tech_info"):
-            st.markdown("**第1章數據源整合**")
-            ch1_integration = param['chapter1_integration']
-            for key, value in ch1_integration.items():
-                st.markdown(f"• **{key}**: {value}")
-            
-            st.markdown("**第2章計算邏輯整合**")
-            ch2_integration = param['chapter2_integration']
-            for key, value in ch2_integration.items():
-                st.markdown(f"• **{key}**: {value}")
+        self._render_tech_info("stock_percentage")
     
     def _render_allocation_pie_chart(self, stock_ratio: int, bond_ratio: int):
         """渲染互動式配置圓餅圖"""
-        try:
-            import plotly.express as px
-            import pandas as pd
-            
-            # 準備圓餅圖數據
-            data = {
-                'asset_type': ['股票', '債券'],
-                'percentage': [stock_ratio, bond_ratio],
-                'colors': ['#3b82f6', '#f59e0b']
-            }
-            
-            df = pd.DataFrame(data)
-            
-            # 創建圓餅圖
-            fig = px.pie(
-                df, 
-                values='percentage', 
-                names='asset_type',
-                title="📊 投資組合配置",
-                color_discrete_sequence=['#3b82f6', '#f59e0b']
-            )
-            
-            # 優化圖表設定
-            fig.update_traces(
-                textposition='inside',
-                textinfo='percent+label',
-                hovertemplate='<b>%{label}</b><br>比例: %{percent}<br>數值: %{value}%<extra></extra>'
-            )
-            
-            fig.update_layout(
-                showlegend=True,
-                height=300,
-                margin=dict(t=50, b=50, l=50, r=50)
-            )
-            
+        if _HAS_PLOTLY:
+            fig = _build_allocation_pie_figure(stock_ratio, bond_ratio)
             st.plotly_chart(fig, use_container_width=True, key="allocation_pie_chart")
-            
-        except ImportError:
+        else:
             # 如果沒有plotly，使用簡單的文字顯示
             st.write("📊 投資組合配置:")
             st.write(f"📈 股票: {stock_ratio}%")
@@ -821,15 +1038,15 @@ class ParameterManager:
     
     def _render_va_growth_rate(self):
         """渲染VA策略目標成長率參數 - 嚴格按照規格"""
-        param = self.basic_params["va_growth_rate"]
+        param = self._schema["va_growth_rate"]
         
         growth_rate = st.slider(
-            param["label"],
-            min_value=param["range"][0],
-            max_value=param["range"][1],
-            step=param["step"],
-            format=f"%.{param['display_precision']}f%%",
-            help=param["help"],
+            param.label,
+            min_value=param.range[0],
+            max_value=param.range[1],
+            step=param.step,
+            format=_VA_GROWTH_FMT,
+            help=param.help,
             key="va_growth_rate"
         )
         
@@ -842,38 +1059,30 @@ class ParameterManager:
             st.info(f"📊 標準成長率: {growth_rate}% - 適用於一般市場情境")
         
         # 顯示第2章整合資訊
-        if st.checkbox("🔧 顯示技術整合資訊", key="show_va_growth_rate_tech_info"):
-            st.markdown("**第2章VA公式核心整合**")
-            ch2_integration = param['chapter2_integration']
-            for key, value in ch2_integration.items():
-                st.markdown(f"• **{key}**: {value}")
-            st.markdown(f"• **內部精度**: {param['precision']} 位小數")
-            st.markdown(f"• **顯示精度**: {param['display_precision']} 位小數")
+        self._render_tech_info("va_growth_rate")
     
     def _render_strategy_type(self):
         """渲染VA策略類型參數 - 嚴格按照規格"""
-        param = self.basic_params["strategy_type"]
+        param = self._schema["strategy_type"]
         
-        # 創建選項標籤
-        options = param["options"]
-        option_labels = [f"{opt['icon']} {opt['label']}" for opt in options]
-        option_values = [opt['value'] for opt in options]
+        # 選項標籤已於建立ParamSchema時組合
+        options = param.options
+        option_values = param.option_values
         
         # 找到當前值的索引
-        current_index = 0
-        try:
-            current_index = option_values.index(st.session_state.strategy_type)
-        except ValueError:
-            current_index = option_values.index(param["default"])
+        current_index = self._strategy_value_to_idx.get(
+            st.session_state.strategy_type,
+            self._strategy_value_to_idx[param.default]
+        )
         
         # 渲染radio buttons
         selected_index = st.radio(
-            param["label"],
+            param.label,
             range(len(options)),
             index=current_index,
-            format_func=lambda x: option_labels[x],
+            format_func=param.option_labels.__getitem__,
             horizontal=True,
-            help=param["help"],
+            help=param.help,
             key="strategy_type_radio"
         )
         
@@ -889,32 +1098,28 @@ class ParameterManager:
         if 'strategy_type' not in st.session_state or st.session_state.strategy_type != selected_strategy:
             st.session_state.strategy_type = selected_strategy
         
-        # 修正：移除嵌套expander，改用checkbox控制顯示技術整合資訊
-        if st.checkbox("🔧 顯示技術整合資訊", key="show_strategy_type_tech_info"):
-            st.markdown("**第2章VA策略執行邏輯整合**")
-            ch2_integration = param['chapter2_integration']
-            for key, value in ch2_integration.items():
-                st.markdown(f"• **{key}**: {value}")
+        # 顯示第2章整合資訊
+        self._render_tech_info("strategy_type")
     
     def _render_inflation_adjustment(self):
         """渲染通膨調整參數 - 嚴格按照規格"""
-        toggle_config = self.basic_params["inflation_adjustment"]["enable_toggle"]
-        rate_config = self.basic_params["inflation_adjustment"]["inflation_rate"]
+        toggle_config = self._schema["inflation_toggle"]
+        rate_config = self._schema["inflation_rate"]
         
         # 通膨調整開關
         inflation_enabled = st.toggle(
-            toggle_config["label"],
-            help=toggle_config["help"],
+            toggle_config.label,
+            help=toggle_config.help,
             key="inflation_adjustment"
         )
         
         # 通膨率設定（條件顯示）
         if inflation_enabled:
             inflation_rate = st.slider(
-                rate_config["label"],
-                min_value=rate_config["range"][0],
-                max_value=rate_config["range"][1],
-                step=rate_config["step"],
+                rate_config.label,
+                min_value=rate_config.range[0],
+                max_value=rate_config.range[1],
+                step=rate_config.step,
                 format="%.1f%%",
                 key="inflation_rate"
             )
@@ -923,41 +1128,26 @@ class ParameterManager:
             st.info(f"📈 通膨調整: DCA投入金額將每年增加 {inflation_rate}%")
             
             # 顯示第2章整合資訊
-            if st.checkbox("🔧 顯示技術整合資訊", key="show_inflation_adjustment_tech_info"):
-                st.markdown("**第2章DCA投入公式整合**")
-                ch2_integration = rate_config['chapter2_integration']
-                for key, value in ch2_integration.items():
-                    st.markdown(f"• **{key}**: {value}")
+            self._render_tech_info("inflation_adjustment")
         else:
             st.info("🔒 通膨調整已關閉，DCA投入金額保持固定")
     
+    @_fragment
     def _render_data_source_selection(self):
         """渲染數據來源選擇 - user_controlled_selection"""
         param = self.basic_params["data_source"]
         
         st.subheader(param["label"])
         
-        # 用戶控制的數據源選擇
-        options = param["user_options"]["options"]
-        
-        # 根據priority排序選項
-        sorted_options = sorted(options, key=lambda x: x['priority'])
-        
-        option_labels = [f"{opt['icon']} {opt['label']}" for opt in sorted_options]
-        option_values = [opt['value'] for opt in sorted_options]
-        
-        # 找到預設選項的索引
-        default_value = param["default_mode"]
-        try:
-            default_index = option_values.index(default_value)
-        except ValueError:
-            default_index = 0
+        # 用戶控制的數據源選擇（選項已於初始化時依priority排序）
+        sorted_options = self._data_source_options
+        option_labels = self._data_source_labels
         
         selected_index = st.radio(
             "請選擇數據來源",
             range(len(sorted_options)),
-            index=default_index,
-            format_func=lambda x: option_labels[x],
+            index=self._data_source_default_index,
+            format_func=option_labels.__getitem__,
             key="data_source_selection",
             help="選擇用於投資分析的數據來源"
         )
@@ -1044,9 +1234,8 @@ class ParameterManager:
             st.success("✅ 已選擇真實市場數據")
             st.info("💡 智能回退機制：若指定期間API數據不足，系統會自動補充模擬數據並通知您")
             
-            # 檢查API金鑰狀態
-            tiingo_key = self._get_api_key('TIINGO_API_KEY')
-            fred_key = self._get_api_key('FRED_API_KEY')
+            # 檢查API金鑰狀態（快取5分鐘）
+            tiingo_key, fred_key = _cached_api_key_presence()
             
             if tiingo_key and fred_key:
                 st.success("🔑 API金鑰已配置完成")
@@ -1059,37 +1248,22 @@ class ParameterManager:
                 
                 # 更友好的API金鑰缺失提示
                 with st.expander("⚠️ API金鑰設定指引", expanded=True):
-                    st.markdown(f"**缺少API金鑰**: {', '.join(missing_keys)}")
-                    st.markdown("**🎯 不用擔心！系統會自動處理：**")
-                    st.markdown("• 🔄 自動切換到高品質模擬數據")
-                    st.markdown("• 📊 所有功能正常運作")
-                    st.markdown("• 🎲 基於真實歷史統計的模擬")
-                    
-                    st.markdown("**🔑 如需使用真實數據，請設定API金鑰：**")
-                    st.markdown("1. **Tiingo API** (股票數據) - [免費註冊](https://api.tiingo.com/)")
-                    st.markdown("2. **FRED API** (債券數據) - [免費註冊](https://fred.stlouisfed.org/docs/api/api_key.html)")
-                    
-                    st.markdown("**📋 Streamlit Cloud設定步驟：**")
-                    st.markdown("1. 點擊右下角 'Manage app'")
-                    st.markdown("2. 進入 'Secrets' 設定")
-                    st.markdown("3. 添加：")
-                    st.code('''TIINGO_API_KEY = "your_tiingo_key_here"
-FRED_API_KEY = "your_fred_key_here"''', language="toml")
+                    st.markdown(self._API_KEY_GUIDE_MD.format(missing=", ".join(missing_keys)))
+                    st.code(self._API_KEY_SECRETS_TOML, language="toml")
                     
                     st.info("💡 **提示**: 即使沒有API金鑰，系統也能完美運行所有功能！")
+                    
+                    if st.button("🔄 重新檢查API金鑰", key="refresh_api_key_status"):
+                        _cached_api_key_presence.clear()
+                        st.rerun()
         
         # 顯示第1章整合資訊
-        if st.checkbox("🔧 顯示技術整合資訊", key="show_data_source_tech_info"):
-            st.markdown("**第1章數據源完整整合**")
-            integration = param["chapter1_integration"]
-            for key, value in integration.items():
-                st.markdown(f"• **{key}**: {value}")
+        self._render_tech_info("data_source")
     
     def _detect_current_data_source(self) -> str:
         """檢測當前數據源狀態 - 整合第1章API機制"""
-        # 檢查API金鑰
-        tiingo_key = self._get_api_key('TIINGO_API_KEY')
-        fred_key = self._get_api_key('FRED_API_KEY')
+        # 檢查API金鑰（快取5分鐘）
+        tiingo_key, fred_key = _cached_api_key_presence()
         
         if tiingo_key and fred_key:
             return "real_data"
@@ -1100,59 +1274,55 @@ FRED_API_KEY = "your_fred_key_here"''', language="toml")
     
     def _get_api_key(self, key_name: str) -> Optional[str]:
         """獲取API金鑰 - 多層級策略"""
-        # 第1層：Streamlit Secrets
-        try:
-            if hasattr(st, 'secrets') and key_name in st.secrets:
-                return st.secrets[key_name]
-        except:
-            pass
-        
-        # 第2層：環境變數
-        return os.environ.get(key_name)
+        return _lookup_api_key(key_name)
     
     def get_all_parameters(self) -> Dict[str, Any]:
         """獲取所有參數值 - 供計算引擎使用"""
+        ss = st.session_state
+        investment_years = ss.investment_years
+        investment_frequency = ss.investment_frequency
+        stock_ratio = ss.stock_ratio
+        total_periods, periods_per_year = _periods_for(investment_years, investment_frequency)
+        inflation_enabled = ss.inflation_adjustment
+        
         return {
             # 基本參數
-            "initial_investment": st.session_state.initial_investment,
-            "annual_investment": st.session_state.annual_investment,
-            "investment_start_date": st.session_state.investment_start_date,
-            "investment_years": st.session_state.investment_years,
-            "investment_frequency": st.session_state.investment_frequency,
-            "stock_ratio": st.session_state.stock_ratio,
-            "bond_ratio": 100 - st.session_state.stock_ratio,
+            "initial_investment": ss.initial_investment,
+            "annual_investment": ss.annual_investment,
+            "investment_start_date": ss.investment_start_date,
+            "investment_years": investment_years,
+            "investment_frequency": investment_frequency,
+            "stock_ratio": stock_ratio,
+            "bond_ratio": 100 - stock_ratio,
             
             # 進階設定
-            "va_growth_rate": st.session_state.va_growth_rate,
-            "inflation_adjustment": st.session_state.inflation_adjustment,
-            "inflation_rate": st.session_state.inflation_rate if st.session_state.inflation_adjustment else 0,
-            "data_source_mode": st.session_state.get("data_source_mode", "real_data"),
-            "strategy_type": st.session_state.get("strategy_type", "Rebalance"),
+            "va_growth_rate": ss.va_growth_rate,
+            "inflation_adjustment": inflation_enabled,
+            "inflation_rate": ss.inflation_rate if inflation_enabled else 0,
+            "data_source_mode": ss.get("data_source_mode", "real_data"),
+            "strategy_type": ss.get("strategy_type", "Rebalance"),
             
             # 計算衍生參數
-            "total_periods": self._calculate_total_periods(),
-            "periods_per_year": self._get_periods_per_year()
+            "total_periods": total_periods,
+            "periods_per_year": periods_per_year
         }
     
     def _calculate_total_periods(self) -> int:
         """計算總投資期數"""
-        frequency_map = {"monthly": 12, "quarterly": 4, "semi_annually": 2, "annually": 1}
-        periods_per_year = frequency_map.get(st.session_state.investment_frequency, 1)
-        return st.session_state.investment_years * periods_per_year
+        return _periods_for(st.session_state.investment_years, st.session_state.investment_frequency)[0]
     
     def _get_periods_per_year(self) -> int:
         """獲取每年期數"""
-        frequency_map = {"monthly": 12, "quarterly": 4, "semi_annually": 2, "annually": 1}
-        return frequency_map.get(st.session_state.investment_frequency, 1)
+        return _periods_for(st.session_state.investment_years, st.session_state.investment_frequency)[1]
     
     def render_calculation_button(self):
         """渲染計算按鈕 - 主要計算觸發點"""
         st.markdown("---")
         st.subheader("🚀 開始計算")
         
-        # 檢查參數完整性
+        # 檢查參數完整性（驗證結果依參數組合快取）
         params = self.get_all_parameters()
-        validation_result = self.validate_parameters()
+        validation_result = self.validate_parameters(params)
         
         if validation_result["is_valid"]:
             # 參數有效，顯示計算按鈕
@@ -1166,10 +1336,12 @@ FRED_API_KEY = "your_fred_key_here"''', language="toml")
                     key="main_calculation_button",
                     help="點擊開始計算VA和DCA策略比較"
                 ):
-                    # 觸發計算
-                    st.session_state.trigger_calculation = True
-                    st.session_state.calculation_params = params
-                    st.rerun()
+                    # 觸發計算（單次執行保護：計算尚未被消化前不重複觸發重跑）
+                    if not st.session_state.get("_calc_in_flight"):
+                        st.session_state._calc_in_flight = True
+                        st.session_state.trigger_calculation = True
+                        st.session_state.calculation_params = params
+                        st.rerun()
             
             # 顯示將要計算的內容預覽
             st.info("📊 將計算以下內容：VA策略表格、DCA策略表格、績效比較分析、投資建議")
@@ -1191,8 +1363,9 @@ FRED_API_KEY = "your_fred_key_here"''', language="toml")
                 )
         
         # 顯示上次計算時間（如果有）
-        if hasattr(st.session_state, 'last_calculation_time') and st.session_state.last_calculation_time:
-            st.caption(f"上次計算時間: {st.session_state.last_calculation_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        last_calculation_time = st.session_state.get('last_calculation_time')
+        if last_calculation_time:
+            st.caption(f"上次計算時間: {_format_calculation_time(last_calculation_time)}")
 
     def render_parameter_summary(self):
         """渲染參數摘要卡片"""
@@ -1200,79 +1373,72 @@ FRED_API_KEY = "your_fred_key_here"''', language="toml")
         
         params = self.get_all_parameters()
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric("💰 期初投入", f"${params['initial_investment']:,}")
-            st.metric("💳 年度投入", f"${params['annual_investment']:,}")
-            st.metric("⏱️ 投資期間", f"{params['investment_years']} 年")
+        summary_values = (
+            ("💰 期初投入", _format_currency(params['initial_investment'])),
+            ("💳 年度投入", _format_currency(params['annual_investment'])),
+            ("⏱️ 投資期間", f"{params['investment_years']} 年"),
+            ("📅 投資頻率", params['investment_frequency']),
+            ("📈 VA目標成長率", _format_percentage(params['va_growth_rate'])),
+            ("📊 股票比例", _format_percentage(params['stock_ratio'])),
+        )
         
-        with col2:
-            st.metric("📅 投資頻率", params['investment_frequency'])
-            st.metric("📈 VA目標成長率", f"{params['va_growth_rate']}%")
-            st.metric("📊 股票比例", f"{params['stock_ratio']}%")
+        # 單一Markdown表格取代兩欄 + 6個st.metric
+        st.markdown(_summary_markdown_table(summary_values))
     
-    def validate_parameters(self) -> Dict[str, Any]:
-        """驗證參數有效性"""
-        params = self.get_all_parameters()
-        validation_result = {
-            "is_valid": True,
-            "errors": [],
-            "warnings": []
-        }
-        
-        # 基本參數驗證
-        if params["initial_investment"] < 0:
-            validation_result["errors"].append("期初投入金額不能為負數")
-            validation_result["is_valid"] = False
-        
-        if params["investment_years"] < 5:
-            validation_result["errors"].append("投資年數不能少於5年")
-            validation_result["is_valid"] = False
-        
-        # 進階參數驗證
-        if params["va_growth_rate"] < -20 or params["va_growth_rate"] > 50:
-            validation_result["errors"].append("VA成長率超出合理範圍(-20%到50%)")
-            validation_result["is_valid"] = False
-        
-        # 警告檢查
-        if params["va_growth_rate"] > 30:
-            validation_result["warnings"].append("高成長率可能不符合實際市場情況")
-        
-        if params["stock_ratio"] > 90:
-            validation_result["warnings"].append("股票比例過高可能增加投資風險")
-        
-        return validation_result
+    def validate_parameters(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """驗證參數有效性 - 可傳入已取得的參數以避免重複讀取會話狀態"""
+        if params is None:
+            params = self.get_all_parameters()
+        return _validate_parameter_values(
+            params["initial_investment"],
+            params["investment_years"],
+            params["va_growth_rate"],
+            params["stock_ratio"]
+        )
     
     def render_mobile_optimized_parameters(self):
         """
         渲染移動端優化參數 - 3.5.1節規格
         簡化交互、大步長、減少小數精度
+        所有輸入包在同一個表單內，僅在按下「套用」時才寫回會話狀態並觸發一次重跑
         """
-        # 獲取設備優化配置
-        device_config = st.session_state.get('device_config', {})
-        step_size = device_config.get('step_size', 1000)
-        decimal_places = device_config.get('decimal_places', 0)
-        show_advanced = device_config.get('show_advanced', False)
-        
-        # 💰 期初投入金額 - 簡化版
-        self._render_mobile_initial_investment(step_size)
-        
-        # ⏱️ 投資年數 - 簡化版
-        self._render_mobile_investment_years()
-        
-        # 📅 投資頻率 - 簡化版
-        self._render_mobile_investment_frequency()
-        
-        # 📊 股債配置 - 簡化版
-        self._render_mobile_asset_allocation()
+        # 獲取設備優化配置（由ResponsiveDesignManager設定，缺少時使用移動端預設）
+        device_config = st.session_state.get('device_config') or _DEFAULT_DEVICE_CONFIG
+        step_size = device_config['step_size']
+        show_advanced = device_config['show_advanced']
+        
+        with st.form("mobile_params_form", clear_on_submit=False):
+            # 💰 期初投入金額 - 簡化版
+            investment_amount = self._render_mobile_initial_investment(step_size)
+            
+            # ⏱️ 投資年數 - 簡化版
+            investment_years = self._render_mobile_investment_years()
+            
+            # 📅 投資頻率 - 簡化版
+            investment_frequency = self._render_mobile_investment_frequency()
+            
+            # 📊 股債配置 - 簡化版
+            stock_ratio = self._render_mobile_asset_allocation()
+            
+            # 進階設定（可選）
+            va_growth_rate = None
+            if show_advanced:
+                with st.expander("🔧 進階設定"):
+                    va_growth_rate = self._render_mobile_advanced_settings()
+            
+            submitted = st.form_submit_button("套用", use_container_width=True)
         
-        # 進階設定（可選）
-        if show_advanced:
-            with st.expander("🔧 進階設定"):
-                self._render_mobile_advanced_settings()
+        # 僅在提交時同步會話狀態
+        if submitted:
+            st.session_state.initial_investment = investment_amount
+            st.session_state.investment_years = investment_years
+            st.session_state.investment_frequency = investment_frequency
+            st.session_state.stock_ratio = stock_ratio
+            st.session_state.bond_ratio = 100 - stock_ratio
+            if va_growth_rate is not None:
+                st.session_state.va_growth_rate = va_growth_rate
     
-    def _render_mobile_initial_investment(self, step_size: int):
+    def _render_mobile_initial_investment(self, step_size: int) -> int:
         """渲染移動端期初投入金額 - 大步長"""
         st.markdown("#### 💰 期初投入金額")
         
@@ -1288,12 +1454,12 @@ FRED_API_KEY = "your_fred_key_here"''', language="toml")
             key="mobile_initial_investment"
         )
         
-        st.session_state.initial_investment = investment_amount
-        
         # 顯示格式化金額
         st.success(f"✅ 投資金額: ${investment_amount:,}")
+        
+        return investment_amount
     
-    def _render_mobile_investment_years(self):
+    def _render_mobile_investment_years(self) -> int:
         """渲染移動端投資年數 - 簡化版"""
         st.markdown("#### ⏱️ 投資年數")
         
@@ -1308,33 +1474,28 @@ FRED_API_KEY = "your_fred_key_here"''', language="toml")
             key="mobile_investment_years"
         )
         
-        st.session_state.investment_years = investment_years
         st.success(f"✅ 投資期間: {investment_years} 年")
+        
+        return investment_years
     
-    def _render_mobile_investment_frequency(self):
+    def _render_mobile_investment_frequency(self) -> str:
         """渲染移動端投資頻率 - 簡化版"""
         st.markdown("#### 📅 投資頻率")
         
-        # 簡化選項
-        frequency_options = {
-            "monthly": "📅 每月",
-            "quarterly": "📅 每季",
-            "annually": "📅 每年"
-        }
-        
         selected_frequency = st.selectbox(
             "",
-            options=list(frequency_options.keys()),
-            index=list(frequency_options.keys()).index(st.session_state.investment_frequency),
-            format_func=lambda x: frequency_options[x],
+            options=self._MOBILE_FREQ_KEYS,
+            index=self._MOBILE_FREQ_INDEX.get(st.session_state.investment_frequency, 0),
+            format_func=self._MOBILE_FREQ_LABELS.__getitem__,
             help="選擇投資頻率",
             key="mobile_investment_frequency"
         )
         
-        st.session_state.investment_frequency = selected_frequency
-        st.success(f"✅ 投資頻率: {frequency_options[selected_frequency]}")
+        st.success(f"✅ 投資頻率: {self._MOBILE_FREQ_LABELS[selected_frequency]}")
+        
+        return selected_frequency
     
-    def _render_mobile_asset_allocation(self):
+    def _render_mobile_asset_allocation(self) -> int:
         """渲染移動端股債配置 - 簡化版"""
         st.markdown("#### 📊 股債配置")
         
@@ -1350,7 +1511,6 @@ FRED_API_KEY = "your_fred_key_here"''', language="toml")
             key="mobile_stock_ratio"
         )
         
-        st.session_state.stock_ratio = stock_ratio
         bond_ratio = 100 - stock_ratio
         
         # 顯示配置摘要
@@ -1359,8 +1519,10 @@ FRED_API_KEY = "your_fred_key_here"''', language="toml")
             st.metric("📈 股票", f"{stock_ratio}%")
         with col2:
             st.metric("🏦 債券", f"{bond_ratio}%")
+        
+        return stock_ratio
     
-    def _render_mobile_advanced_settings(self):
+    def _render_mobile_advanced_settings(self) -> float:
         """渲染移動端進階設定 - 簡化版"""
         # VA目標成長率
         va_growth_rate = st.slider(
@@ -1374,7 +1536,7 @@ FRED_API_KEY = "your_fred_key_here"''', language="toml")
             key="mobile_va_growth_rate"
         )
         
-        st.session_state.va_growth_rate = va_growth_rate
+        return va_growth_rate
     
     def render_complete_parameter_panel(self):
         """
@@ -6,6 +6,13 @@
 import streamlit as st
 from typing import Dict, Any, Optional, Tuple
 import json
+import re
+from bisect import bisect_right
+from types import MappingProxyType
+
+from .parameter_manager import ParameterManager
+from .results_display import ResultsDisplayManager
+from .smart_recommendations import SmartRecommendationsManager
 
 # 3.5.1 設備檢測與適配實作
 DEVICE_BREAKPOINTS = {
@@ -293,88 +300,328 @@ RESPONSIVE_CSS = """
 </style>
 """
 
+# 各設備優化規則（不含<style>標籤，由_DEVICE_CSS依媒體條件包裝）
+# 移動端優化CSS - 嚴格按照MOBILE_OPTIMIZED_COMPONENTS規格
+_MOBILE_CSS = """
+/* 觸控友善控件 - touch_friendly_controls */
+.stButton > button {
+    min-height: 48px !important;
+    padding: 12px 24px !important;
+    font-size: 16px !important;
+    border-radius: 8px !important;
+    font-weight: 500 !important;
+    transition: all 0.2s ease !important;
+}
+
+.stButton > button:active {
+    transform: scale(0.98) !important;
+    opacity: 0.8 !important;
+}
+
+.stSlider > div > div > div {
+    min-height: 48px !important;
+}
+
+.stSlider > div > div > div > div > div {
+    height: 24px !important;
+    width: 24px !important;
+}
+
+/* 可讀性排版 - readable_typography */
+.stMarkdown p,
+.stMarkdown li,
+.stMarkdown span {
+    font-size: 16px !important;
+    line-height: 1.6 !important;
+    color: #1a202c !important;
+}
+
+.stMarkdown h1 {
+    font-size: 1.75rem !important;
+    line-height: 1.3 !important;
+    color: #1a202c !important;
+}
+
+.stMarkdown h2 {
+    font-size: 1.5rem !important;
+    line-height: 1.4 !important;
+    color: #1a202c !important;
+}
+
+.stMarkdown h3 {
+    font-size: 1.25rem !important;
+    line-height: 1.5 !important;
+    color: #1a202c !important;
+}
+
+/* 簡化交互 - simplified_interactions */
+.stNumberInput > div > div > input {
+    font-size: 16px !important;
+    padding: 12px !important;
+    border-radius: 6px !important;
+}
+
+.stSelectbox > div > div > div {
+    font-size: 16px !important;
+    padding: 12px !important;
+}
+
+/* 效能優化 - performance_optimization */
+.stPlotlyChart {
+    opacity: 0;
+    animation: fadeIn 0.3s ease-in-out forwards;
+}
+
+@keyframes fadeIn {
+    to { opacity: 1; }
+}
+
+/* 最小動畫 */
+* {
+    animation-duration: 0.2s !important;
+    transition-duration: 0.2s !important;
+}
+"""
+
+# 平板端優化CSS
+_TABLET_CSS = """
+.stButton > button {
+    min-height: 44px !important;
+    font-size: 15px !important;
+}
+
+.stMarkdown h1 {
+    font-size: 2rem !important;
+}
+
+.stMarkdown h2 {
+    font-size: 1.75rem !important;
+}
+
+.stMarkdown h3 {
+    font-size: 1.5rem !important;
+}
+"""
+
+# 桌面端優化CSS
+_DESKTOP_CSS = """
+.stButton > button {
+    transition: all 0.2s ease !important;
+}
+
+.stButton > button:hover {
+    transform: translateY(-1px) !important;
+    box-shadow: 0 4px 12px rgba(0,0,0,0.15) !important;
+}
+
+.desktop-layout {
+    display: grid;
+    grid-template-columns: 350px 1fr 300px;
+    gap: 1.5rem;
+}
+"""
+
+# 各設備樣式以<style media>分別注入，由瀏覽器依實際寬度啟用，不需Python端判斷設備
+_DEVICE_MEDIA_SHEETS = (
+    ("(max-width: 767px)", _MOBILE_CSS),
+    ("(min-width: 768px) and (max-width: 1023px)", _TABLET_CSS),
+    ("(min-width: 1024px)", _DESKTOP_CSS),
+)
+_DEVICE_CSS = "".join(
+    f'<style media="{media}">\n{css}</style>\n' for media, css in _DEVICE_MEDIA_SHEETS
+)
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};:,>])\s*")
+
+def _minify_css(css: str) -> str:
+    """壓縮CSS：移除註解並收斂空白，於模組載入時執行一次"""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+# 實際注入頁面的壓縮樣式
+RESPONSIVE_CSS_MIN = _minify_css(RESPONSIVE_CSS)
+_RESPONSIVE_STYLESHEET = RESPONSIVE_CSS_MIN + _minify_css(_DEVICE_CSS)
+
+# 斷點查表（依門檻遞增排序）：mobile < 768px <= tablet < 1024px <= desktop
+_BREAKPOINT_TABLE = tuple(sorted((width, device) for device, width in DEVICE_BREAKPOINTS.items()))
+_BREAKPOINT_THRESHOLDS = tuple(width for width, _ in _BREAKPOINT_TABLE)
+_BREAKPOINT_DEVICES = tuple(device for _, device in _BREAKPOINT_TABLE)
+
+def _classify_device(screen_width: int) -> str:
+    """依斷點規格將螢幕寬度歸類為設備類型"""
+    return _BREAKPOINT_DEVICES[max(bisect_right(_BREAKPOINT_THRESHOLDS, screen_width) - 1, 0)]
+
+# 螢幕寬度探針：將主視窗寬度寫入網址查詢參數screen_width（刻意公開於網址），下一輪rerun由st.query_params讀回
+# 僅在參數缺少或跨越斷點時才改寫網址；元件iframe與主頁面不同源時無法存取window.parent，直接放棄（回退預設寬度）
+_SCREEN_WIDTH_PROBE = """
+<script>
+(function() {
+    let host;
+    try {
+        host = window.parent;
+        host.location.href;
+    } catch (e) {
+        return;
+    }
+    
+    // 每個主頁面只安裝一次監聽器（每輪rerun可能重建探針iframe）
+    if (host.__screenWidthProbe) {
+        return;
+    }
+    host.__screenWidthProbe = true;
+    
+    // 依斷點歸類寬度（與DEVICE_BREAKPOINTS一致）
+    function getBucket(width) {
+        return width >= 1024 ? 'desktop' : (width >= 768 ? 'tablet' : 'mobile');
+    }
+    
+    // 以replaceState改寫網址，不重新載入頁面
+    function report(width) {
+        const url = new host.URL(host.location.href);
+        url.searchParams.set('screen_width', width);
+        host.history.replaceState(host.history.state, '', url);
+    }
+    
+    // 初次載入：網址缺少參數或其斷點與目前寬度不同時才寫入
+    const current = parseInt(new host.URL(host.location.href).searchParams.get('screen_width'), 10);
+    let lastBucket = getBucket(host.innerWidth);
+    if (isNaN(current) || getBucket(current) !== lastBucket) {
+        report(host.innerWidth);
+    }
+    
+    // 監聽主視窗大小變化（200ms防抖，計時器掛在主視窗上，僅在跨越斷點時才寫入）
+    let resizeTimer;
+    host.addEventListener('resize', function() {
+        host.clearTimeout(resizeTimer);
+        resizeTimer = host.setTimeout(function() {
+            const width = host.innerWidth;
+            const bucket = getBucket(width);
+            if (bucket !== lastBucket) {
+                lastBucket = bucket;
+                report(width);
+            }
+        }, 200);
+    });
+})();
+</script>
+"""
+
+# 手機版標籤導航
+_MOBILE_TABS = ("🎯 設定", "📊 結果", "💡 建議")
+
+# 移動端快捷預設參數（唯讀，模組載入時建立一次）
+_PRESETS = MappingProxyType({
+    "conservative": MappingProxyType({
+        "initial_investment": 10000,
+        "investment_frequency": "quarterly",
+        "investment_periods": 20,
+        "monthly_investment": 1000
+    }),
+    "balanced": MappingProxyType({
+        "initial_investment": 50000,
+        "investment_frequency": "monthly",
+        "investment_periods": 60,
+        "monthly_investment": 3000
+    }),
+    "aggressive": MappingProxyType({
+        "initial_investment": 10000,
+        "investment_frequency": "monthly",
+        "investment_periods": 120,
+        "monthly_investment": 5000
+    })
+})
+
+def _get_parameter_manager():
+    """取得本session共用的參數管理器（與app.py共用同一實例）"""
+    if "parameter_manager" not in st.session_state:
+        st.session_state.parameter_manager = ParameterManager()
+    return st.session_state.parameter_manager
+
+def _get_results_display_manager():
+    """取得本session共用的結果展示管理器（與app.py共用同一實例）"""
+    if "results_manager" not in st.session_state:
+        st.session_state.results_manager = ResultsDisplayManager()
+    return st.session_state.results_manager
+
+def _get_smart_recommendations_manager():
+    """取得本session共用的智能建議管理器"""
+    if "smart_recommendations_manager" not in st.session_state:
+        st.session_state.smart_recommendations_manager = SmartRecommendationsManager()
+    return st.session_state.smart_recommendations_manager
+
 class ResponsiveDesignManager:
     """響應式設計管理器 - 實作第3章3.5節所有規格"""
     
     def __init__(self):
         self.device_breakpoints = DEVICE_BREAKPOINTS
         self.mobile_components = MOBILE_OPTIMIZED_COMPONENTS
-        self.current_device = self._detect_device_type()
         self.screen_width = self._get_screen_width()
+        self.current_device = _classify_device(self.screen_width)
         
     def _get_screen_width(self) -> int:
         """獲取螢幕寬度"""
-        # 使用JavaScript檢測螢幕寬度
-        screen_width_js = """
-        <script>
-        function getScreenWidth() {
-            return window.innerWidth;
-        }
-        
-        // 將螢幕寬度存儲到sessionStorage
-        sessionStorage.setItem('screen_width', window.innerWidth);
-        
-        // 監聽窗口大小變化
-        window.addEventListener('resize', function() {
-            sessionStorage.setItem('screen_width', window.innerWidth);
-        });
-        </script>
-        """
-        
-        # 注入JavaScript
-        st.components.v1.html(screen_width_js, height=0)
-        
-        # 從session_state獲取螢幕寬度，預設為1024（桌面）
+        # 優先使用前端探針回報的網址參數，尚未回報時沿用session_state，預設為1024（桌面）
+        query_params = getattr(st, "query_params", None)
+        reported = query_params.get("screen_width") if query_params is not None else None
+        if reported and reported.isdigit():
+            return int(reported)
         return st.session_state.get("screen_width", 1024)
     
     def _detect_device_type(self) -> str:
         """檢測設備類型 - 嚴格按照斷點規格"""
         # 使用當前螢幕寬度（可能已被測試設置）
-        screen_width = getattr(self, 'screen_width', self._get_screen_width())
-        
-        if screen_width >= self.device_breakpoints["desktop"]:  # >= 1024px
-            return "desktop"
-        elif screen_width >= self.device_breakpoints["tablet"]:  # >= 768px
-            return "tablet"
-        else:  # < 768px
-            return "mobile"
+        return _classify_device(self.screen_width)
     
     def detect_device_and_layout(self):
         """
         檢測設備類型並調整布局 - 嚴格按照3.5.1節規格
         """
-        screen_width = self._get_screen_width()
+        # 注入寬度探針（每輪重新送出，元素內容不變時前端不會重新載入）
+        st.components.v1.html(_SCREEN_WIDTH_PROBE, height=0)
         
-        # 更新session_state
-        st.session_state.screen_width = screen_width
+        # 每輪只讀取一次寬度，同步更新實例上的寬度與設備類型
+        screen_width = self.screen_width = self._get_screen_width()
         
         # 根據螢幕寬度選擇布局模式
-        if screen_width >= 1024:
-            st.session_state.layout_mode = "desktop"
+        layout_mode = self.current_device = _classify_device(screen_width)
+        
+        # 僅在跨越斷點時更新session_state，同一斷點內的寬度變化不觸發狀態寫入
+        if st.session_state.get("layout_mode") != layout_mode:
+            st.session_state.screen_width = screen_width
+            st.session_state.layout_mode = layout_mode
+        
+        if layout_mode == "desktop":
             return self.render_desktop_layout()
-        elif screen_width >= 768:
-            st.session_state.layout_mode = "tablet"
+        elif layout_mode == "tablet":
             return self.render_tablet_layout()
         else:
-            st.session_state.layout_mode = "mobile"
             return self.render_mobile_layout()
     
     def render_mobile_layout(self):
         """
         手機版標籤式導航布局 - 嚴格按照3.5.1節規格
         """
-        # 必須使用st.tabs()創建標籤導航
-        tab1, tab2, tab3 = st.tabs(["🎯 設定", "📊 結果", "💡 建議"])
+        # 標籤式導航：st.tabs會在每次rerun渲染全部標籤內容，
+        # 改以水平選項記錄目前標籤，只渲染使用中的標籤（圖表與建議計算不再於隱藏標籤執行）
+        active_tab = st.radio(
+            "手機版導航",
+            _MOBILE_TABS,
+            horizontal=True,
+            label_visibility="collapsed",
+            key="_active_mobile_tab"
+        )
         
-        with tab1:
+        if active_tab == _MOBILE_TABS[0]:
             # 調用render_simplified_parameters()
             self.render_simplified_parameters()
-        
-        with tab2:
+        elif active_tab == _MOBILE_TABS[1]:
             # 調用render_mobile_optimized_results()
             self.render_mobile_optimized_results()
-            
-        with tab3:
+        else:
             # 調用render_compact_recommendations()
             self.render_compact_recommendations()
     
@@ -413,65 +660,36 @@ class ResponsiveDesignManager:
         """
         渲染簡化參數設定 - 移動端優化
         """
-        from .parameter_manager import ParameterManager
-        
         st.markdown("### 🎯 投資參數設定")
         
-        # 創建參數管理器
-        if not hasattr(self, '_parameter_manager'):
-            self._parameter_manager = ParameterManager()
-        
         # 移動端優化：使用預設值快捷按鈕
         self._render_mobile_preset_buttons()
         
         # 渲染簡化的參數輸入
-        self._parameter_manager.render_mobile_optimized_parameters()
+        _get_parameter_manager().render_mobile_optimized_parameters()
     
     def render_mobile_optimized_results(self):
         """
         渲染移動端優化結果 - 3.5.1節規格
         """
-        from .results_display import ResultsDisplayManager
-        
         st.markdown("### 📊 策略比較結果")
         
-        # 創建結果展示管理器
-        if not hasattr(self, '_results_display_manager'):
-            self._results_display_manager = ResultsDisplayManager()
-        
-        # 獲取參數
-        if hasattr(self, '_parameter_manager'):
-            parameters = self._parameter_manager.get_all_parameters()
-            
-            # 渲染移動端優化的結果
-            self._results_display_manager.render_mobile_optimized_results(parameters)
-        else:
-            st.info("請先在「🎯 設定」標籤中設定投資參數")
+        # 獲取參數並渲染移動端優化的結果
+        parameters = _get_parameter_manager().get_all_parameters()
+        _get_results_display_manager().render_mobile_optimized_results(parameters)
     
     def render_compact_recommendations(self):
         """
         渲染緊湊建議 - 3.5.1節規格
         """
-        from .smart_recommendations import SmartRecommendationsManager
-        
         st.markdown("### 💡 智能投資建議")
         
-        # 創建智能建議管理器
-        if not hasattr(self, '_smart_recommendations_manager'):
-            self._smart_recommendations_manager = SmartRecommendationsManager()
-        
         # 獲取參數和結果
-        parameters = {}
-        calculation_results = {}
-        
-        if hasattr(self, '_parameter_manager'):
-            parameters = self._parameter_manager.get_all_parameters()
-        
-        if hasattr(self, '_results_display_manager') and hasattr(self._results_display_manager, 'calculation_results'):
-            calculation_results = self._results_display_manager.calculation_results
+        parameters = _get_parameter_manager().get_all_parameters()
+        calculation_results = _get_results_display_manager().calculation_results
         
         # 渲染緊湊版建議
-        self._smart_recommendations_manager.render_compact_recommendations(
+        _get_smart_recommendations_manager().render_compact_recommendations(
             parameters, calculation_results
         )
     
@@ -479,61 +697,26 @@ class ResponsiveDesignManager:
         """
         渲染完整參數面板 - 桌面版
         """
-        from .parameter_manager import ParameterManager
-        
-        # 創建參數管理器
-        if not hasattr(self, '_parameter_manager'):
-            self._parameter_manager = ParameterManager()
-        
-        # 渲染完整參數面板
-        self._parameter_manager.render_complete_parameter_panel()
+        _get_parameter_manager().render_complete_parameter_panel()
     
     def render_main_results_area(self):
         """
         渲染主結果區域 - 桌面版
         """
-        from .results_display import ResultsDisplayManager
-        
-        # 創建結果展示管理器
-        if not hasattr(self, '_results_display_manager'):
-            self._results_display_manager = ResultsDisplayManager()
-        
-        # 獲取參數
-        if hasattr(self, '_parameter_manager'):
-            parameters = self._parameter_manager.get_all_parameters()
-            
-            # 檢查是否有計算觸發
-            if st.session_state.get('trigger_calculation', False):
-                # 確保結果顯示管理器知道計算觸發
-                st.session_state.trigger_calculation = True
-            
-            # 渲染完整結果區域
-            self._results_display_manager.render_complete_results_display(parameters)
-        else:
-            st.info("請先設定投資參數")
+        # 獲取參數並渲染完整結果區域
+        parameters = _get_parameter_manager().get_all_parameters()
+        _get_results_display_manager().render_complete_results_display(parameters)
     
     def render_smart_suggestions_panel(self):
         """
         渲染智能建議面板 - 桌面版
         """
-        from .smart_recommendations import SmartRecommendationsManager
-        
-        # 創建智能建議管理器
-        if not hasattr(self, '_smart_recommendations_manager'):
-            self._smart_recommendations_manager = SmartRecommendationsManager()
-        
         # 獲取參數和結果
-        parameters = {}
-        calculation_results = {}
-        
-        if hasattr(self, '_parameter_manager'):
-            parameters = self._parameter_manager.get_all_parameters()
-        
-        if hasattr(self, '_results_display_manager') and hasattr(self._results_display_manager, 'calculation_results'):
-            calculation_results = self._results_display_manager.calculation_results
+        parameters = _get_parameter_manager().get_all_parameters()
+        calculation_results = _get_results_display_manager().calculation_results
         
         # 渲染完整智能建議
-        self._smart_recommendations_manager.render_complete_smart_recommendations(
+        _get_smart_recommendations_manager().render_complete_smart_recommendations(
             parameters, calculation_results
         )
     
@@ -561,186 +744,16 @@ class ResponsiveDesignManager:
         """
         應用預設參數 - 大步長、減少小數精度
         """
-        presets = {
-            "conservative": {
-                "initial_investment": 10000,
-                "investment_frequency": "quarterly",
-                "investment_periods": 20,
-                "monthly_investment": 1000
-            },
-            "balanced": {
-                "initial_investment": 50000,
-                "investment_frequency": "monthly",
-                "investment_periods": 60,
-                "monthly_investment": 3000
-            },
-            "aggressive": {
-                "initial_investment": 10000,
-                "investment_frequency": "monthly",
-                "investment_periods": 120,
-                "monthly_investment": 5000
-            }
-        }
-        
-        if preset_type in presets:
-            for key, value in presets[preset_type].items():
-                st.session_state[key] = value
+        preset = _PRESETS.get(preset_type)
+        if preset:
+            st.session_state.update(preset)
     
     def apply_responsive_styling(self):
         """
         應用響應式CSS樣式 - 完整實作3.5.2節規格
         """
-        # 注入響應式CSS
-        st.markdown(RESPONSIVE_CSS, unsafe_allow_html=True)
-        
-        # 根據設備類型應用特定樣式
-        if self.current_device == "mobile":
-            self._apply_mobile_optimizations()
-        elif self.current_device == "tablet":
-            self._apply_tablet_optimizations()
-        else:
-            self._apply_desktop_optimizations()
-    
-    def _apply_mobile_optimizations(self):
-        """
-        應用移動端優化 - 嚴格按照MOBILE_OPTIMIZED_COMPONENTS規格
-        """
-        mobile_css = """
-        <style>
-        /* 觸控友善控件 - touch_friendly_controls */
-        .stButton > button {
-            min-height: 48px !important;
-            padding: 12px 24px !important;
-            font-size: 16px !important;
-            border-radius: 8px !important;
-            font-weight: 500 !important;
-            transition: all 0.2s ease !important;
-        }
-        
-        .stButton > button:active {
-            transform: scale(0.98) !important;
-            opacity: 0.8 !important;
-        }
-        
-        .stSlider > div > div > div {
-            min-height: 48px !important;
-        }
-        
-        .stSlider > div > div > div > div > div {
-            height: 24px !important;
-            width: 24px !important;
-        }
-        
-        /* 可讀性排版 - readable_typography */
-        .stMarkdown p,
-        .stMarkdown li,
-        .stMarkdown span {
-            font-size: 16px !important;
-            line-height: 1.6 !important;
-            color: #1a202c !important;
-        }
-        
-        .stMarkdown h1 {
-            font-size: 1.75rem !important;
-            line-height: 1.3 !important;
-            color: #1a202c !important;
-        }
-        
-        .stMarkdown h2 {
-            font-size: 1.5rem !important;
-            line-height: 1.4 !important;
-            color: #1a202c !important;
-        }
-        
-        .stMarkdown h3 {
-            font-size: 1.25rem !important;
-            line-height: 1.5 !important;
-            color: #1a202c !important;
-        }
-        
-        /* 簡化交互 - simplified_interactions */
-        .stNumberInput > div > div > input {
-            font-size: 16px !important;
-            padding: 12px !important;
-            border-radius: 6px !important;
-        }
-        
-        .stSelectbox > div > div > div {
-            font-size: 16px !important;
-            padding: 12px !important;
-        }
-        
-        /* 效能優化 - performance_optimization */
-        .stPlotlyChart {
-            opacity: 0;
-            animation: fadeIn 0.3s ease-in-out forwards;
-        }
-        
-        @keyframes fadeIn {
-            to { opacity: 1; }
-        }
-        
-        /* 最小動畫 */
-        * {
-            animation-duration: 0.2s !important;
-            transition-duration: 0.2s !important;
-        }
-        </style>
-        """
-        
-        st.markdown(mobile_css, unsafe_allow_html=True)
-    
-    def _apply_tablet_optimizations(self):
-        """
-        應用平板端優化
-        """
-        tablet_css = """
-        <style>
-        .stButton > button {
-            min-height: 44px !important;
-            font-size: 15px !important;
-        }
-        
-        .stMarkdown h1 {
-            font-size: 2rem !important;
-        }
-        
-        .stMarkdown h2 {
-            font-size: 1.75rem !important;
-        }
-        
-        .stMarkdown h3 {
-            font-size: 1.5rem !important;
-        }
-        </style>
-        """
-        
-        st.markdown(tablet_css, unsafe_allow_html=True)
-    
-    def _apply_desktop_optimizations(self):
-        """
-        應用桌面端優化
-        """
-        desktop_css = """
-        <style>
-        .stButton > button {
-            transition: all 0.2s ease !important;
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-1px) !important;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15) !important;
-        }
-        
-        .desktop-layout {
-            display: grid;
-            grid-template-columns: 350px 1fr 300px;
-            gap: 1.5rem;
-        }
-        </style>
-        """
-        
-        st.markdown(desktop_css, unsafe_allow_html=True)
+        # 以單一元素注入基礎與各設備樣式（Streamlit每次rerun只保留本輪輸出的元素，樣式須每輪重新送出）
+        st.markdown(_RESPONSIVE_STYLESHEET, unsafe_allow_html=True)
     
     def get_current_device(self) -> str:
         """獲取當前設備類型"""
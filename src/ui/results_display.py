@@ -6,33 +6,49 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import io
+import json
+import hashlib
+import time
+import logging
 from typing import Dict, Any, Optional, Union, List, Tuple
-import os
-import sys
+from dataclasses import dataclass
+from functools import lru_cache, wraps
 from datetime import datetime, timedelta
-import altair as alt
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
-# 添加src目錄到Python路徑
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except ImportError:  # 舊版Streamlit無此介面，背景執行緒不附加執行情境
+    add_script_run_ctx = get_script_run_ctx = None
 
-# 導入第2章計算模組
-from models.calculation_formulas import calculate_annualized_return
-from models.strategy_engine import calculate_va_strategy, calculate_dca_strategy
-from models.table_calculator import calculate_summary_metrics
-from models.table_specifications import VA_COLUMNS_ORDER, DCA_COLUMNS_ORDER, PERCENTAGE_PRECISION_RULES
-from models.chart_visualizer import (
-    create_strategy_comparison_chart, 
-    create_bar_chart, 
-    create_line_chart,
-    create_scatter_chart,
-    create_drawdown_chart,
-    create_risk_return_scatter,
-    create_investment_flow_chart,
-    create_allocation_pie_chart
-)
+# 導入第2章計算模組（圖表與繪圖套件於各渲染方法內延遲導入，縮短首次載入時間）
+from ..models.calculation_formulas import calculate_annualized_return, FREQUENCY_MAPPING
+from ..models.strategy_engine import calculate_va_strategy, calculate_dca_strategy
+from ..models.table_calculator import calculate_summary_metrics
+from ..models.table_specifications import VA_COLUMNS_ORDER, DCA_COLUMNS_ORDER, PERCENTAGE_PRECISION_RULES
+from ..utils.trading_days import calculate_period_dates
+from ..utils.logger import get_component_logger
+
+# 局部重跑裝飾器：st.fragment（1.37+），舊版退回 experimental_fragment，再不支援則直接執行
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+def _requires_results(fallback_msg: Optional[str] = None):
+    """
+    尚無計算結果時直接返回（可選擇顯示提示訊息）
+    僅用於輸出以此檢查開頭的渲染方法；檢查前需先顯示標題的方法保留方法內的檢查
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not self.calculation_results:
+                if fallback_msg:
+                    st.info(fallback_msg)
+                return None
+            return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
 
 # ============================================================================
 # 3.3.1 頂部摘要卡片實作 - SUMMARY_METRICS_DISPLAY
@@ -125,6 +141,27 @@ STRATEGY_COMPARISON_CARDS = {
     }
 }
 
+@dataclass(frozen=True)
+class StrategyCardSpec:
+    """策略對比卡片的渲染規格（由STRATEGY_COMPARISON_CARDS預先轉換）"""
+    title: str
+    key_feature: str
+    suitability: str
+    pros: Tuple[str, ...]
+    cons: Tuple[str, ...]
+
+# 模組載入時轉換一次，渲染時以屬性存取取代多層字典查找
+_STRATEGY_CARD_SPECS = MappingProxyType({
+    key: StrategyCardSpec(
+        title=card["title"],
+        key_feature=card["key_feature"],
+        suitability=card["content"]["suitability"],
+        pros=tuple(card["pros"]),
+        cons=tuple(card["cons"])
+    )
+    for key, card in STRATEGY_COMPARISON_CARDS.items()
+})
+
 # ============================================================================
 # 3.3.3 圖表顯示實作 - SIMPLIFIED_CHARTS_CONFIG
 # ============================================================================
@@ -227,6 +264,378 @@ DATA_TABLES_CONFIG = {
     }
 }
 
+# ============================================================================
+# 3.5.1 移動端指標卡片 - 依指標類型查表渲染
+# ============================================================================
+
+_MOBILE_STRATEGY_NAMES = MappingProxyType({
+    "va": "定期定值 (VA)",
+    "dca": "定期定額 (DCA)"
+})
+
+@dataclass(frozen=True)
+class MetricContext:
+    """移動端指標卡片共用的比較結果（每次渲染計算一次）"""
+    winner_return: str
+    winner_value: str
+    va_value: float
+    dca_value: float
+    va_return: float
+    dca_return: float
+
+# 指標類型 -> (標籤, 比較基準, 數值格式, 差距格式, 說明格式)，比較基準為"return"或"value"
+_MOBILE_METRIC_CARDS = MappingProxyType({
+    "recommended_strategy": (
+        "🎯 推薦策略",
+        "return",
+        lambda winner, value: _MOBILE_STRATEGY_NAMES[winner],
+        lambda diff: f"優勢 {diff:.1f}%",
+        lambda winner: "基於年化報酬率的推薦"
+    ),
+    "expected_final_value": (
+        "💰 預期最終價值",
+        "value",
+        lambda winner, value: f"${value:,.0f}",
+        lambda diff: f"+${diff:,.0f}",
+        lambda winner: f"{winner.upper()}策略預期最終價值較高"
+    ),
+    "annualized_return": (
+        "📈 年化報酬率",
+        "return",
+        lambda winner, value: f"{value:.1f}%",
+        lambda diff: f"+{diff:.1f}%",
+        lambda winner: f"{winner.upper()}策略年化報酬率較高"
+    )
+})
+
+# ============================================================================
+# 市場數據快取 - 相同日期範圍的API請求在TTL內直接取用快取
+# ============================================================================
+
+@st.cache_resource(show_spinner=False)
+def _get_tiingo_fetcher(api_key: str):
+    """依API金鑰共用Tiingo數據獲取器（金鑰驗證與容錯管理器只初始化一次）"""
+    from src.data_sources.tiingo_client import TiingoDataFetcher
+    
+    return TiingoDataFetcher(api_key)
+
+@st.cache_resource(show_spinner=False)
+def _get_fred_fetcher(api_key: str):
+    """依API金鑰共用FRED數據獲取器（金鑰驗證與容錯管理器只初始化一次）"""
+    from src.data_sources.fred_client import FREDDataFetcher
+    
+    return FREDDataFetcher(api_key)
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _fetch_spy_prices(start_date_str: str, end_date_str: str) -> Tuple[np.ndarray, np.ndarray]:
+    """獲取依日期排序的SPY價格（小數點後2位）；API金鑰於函數內讀取，不納入快取鍵，失敗時拋出例外不寫入快取"""
+    from src.data_sources import get_api_key
+    
+    fetcher = _get_tiingo_fetcher(get_api_key('TIINGO_API_KEY'))
+    spy_prices = fetcher.get_spy_prices(start_date_str, end_date_str)
+    return _sorted_observations(
+        [data_point.date for data_point in spy_prices],
+        [round(data_point.spy_price, 2) for data_point in spy_prices]
+    )
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _fetch_treasury_yields(start_date_str: str, end_date_str: str) -> Tuple[np.ndarray, np.ndarray]:
+    """獲取依日期排序的1年期美債殖利率DGS1（小數點後4位）；API金鑰於函數內讀取，不納入快取鍵，失敗時拋出例外不寫入快取"""
+    from src.data_sources import get_api_key
+    
+    fetcher = _get_fred_fetcher(get_api_key('FRED_API_KEY'))
+    bond_yields = fetcher.get_treasury_yields(start_date_str, end_date_str, 'DGS1')
+    return _sorted_observations(
+        [data_point.date for data_point in bond_yields],
+        [round(data_point.bond_yield, 4) for data_point in bond_yields]
+    )
+
+# 影響模擬數據的session_state鍵：參數相同但這些狀態改變時仍須重新計算
+_SIMULATION_STATE_KEYS = (
+    "simulation_seed_mode",
+    "custom_simulation_seed",
+    "simulation_seed",
+    "simulation_market_bias",
+    "simulation_volatility_level",
+    "simulation_regeneration_count",
+)
+
+def _calculation_key(parameters: Dict[str, Any]) -> str:
+    """由投資參數與模擬數據狀態產生雜湊鍵，用於判斷能否沿用上次計算結果"""
+    simulation_state = {key: st.session_state.get(key) for key in _SIMULATION_STATE_KEYS}
+    payload = json.dumps({"parameters": parameters, "simulation": simulation_state}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _calculate_strategies(parameters: Dict[str, Any], market_data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """執行VA/DCA策略與綜合比較計算 - 純計算，依參數與市場數據快取"""
+    # 轉換頻率格式（UI使用小寫，計算函數期望大寫開頭）
+    frequency_mapping = {
+        "monthly": "Monthly",
+        "quarterly": "Quarterly", 
+        "semi_annually": "Semi-annually",
+        "annually": "Annually"
+    }
+    calculation_frequency = frequency_mapping.get(parameters["investment_frequency"], "Annually")
+    
+    # VA策略計算
+    va_rebalance_df = calculate_va_strategy(
+        C0=parameters["initial_investment"],
+        annual_investment=parameters["annual_investment"],  # 使用正確的年度投入金額
+        annual_growth_rate=parameters["va_growth_rate"],  # 直接使用，不需要除以100
+        annual_inflation_rate=parameters["inflation_rate"],  # 直接使用，不需要除以100
+        investment_years=parameters["investment_years"],
+        frequency=calculation_frequency,  # 使用轉換後的頻率
+        stock_ratio=parameters["stock_ratio"],  # 直接使用，不需要除以100
+        strategy_type=parameters.get("strategy_type", "Rebalance"),  # 修正：使用用戶選擇的策略類型
+        market_data=market_data
+    )
+    
+    # DCA策略計算
+    dca_df = calculate_dca_strategy(
+        C0=parameters["initial_investment"],
+        annual_investment=parameters["annual_investment"],  # 使用正確的年度投入金額
+        annual_growth_rate=parameters["va_growth_rate"],  # 直接使用，不需要除以100
+        annual_inflation_rate=parameters["inflation_rate"],  # 直接使用，不需要除以100
+        investment_years=parameters["investment_years"],
+        frequency=calculation_frequency,  # 使用轉換後的頻率
+        stock_ratio=parameters["stock_ratio"],  # 直接使用，不需要除以100
+        market_data=market_data
+    )
+    
+    # 綜合比較指標
+    summary_df = calculate_summary_metrics(
+        va_rebalance_df=va_rebalance_df,
+        va_nosell_df=None,
+        dca_df=dca_df,
+        initial_investment=parameters["initial_investment"],
+        periods_per_year=parameters["periods_per_year"]
+    )
+    
+    return va_rebalance_df, dca_df, summary_df
+
+def _index_summary_rows(summary_df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """將績效摘要轉為以策略名稱為鍵的列字典（重複策略取第一列）"""
+    return summary_df.drop_duplicates("Strategy").set_index("Strategy").to_dict(orient="index")
+
+def _sorted_observations(date_strs: List[str], values: List[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """將觀測日期字串與數值轉為依日期排序的datetime64[D]與float64陣列"""
+    dates = np.array(date_strs, dtype='datetime64[D]')
+    values = np.array(values, dtype=np.float64)
+    order = np.argsort(dates, kind='stable')
+    return dates[order], values[order]
+
+def _nearest_observations(dates: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """以二分搜尋一次找出各目標日期最接近的觀測索引與相差天數（距離相同時取較早日期；無觀測時不可使用）"""
+    if len(dates) == 0:
+        return np.zeros(len(targets), dtype=np.int64), np.zeros(len(targets), dtype=np.int64)
+    
+    idx = np.searchsorted(dates, targets)
+    before = np.maximum(idx - 1, 0)
+    after = np.minimum(idx, len(dates) - 1)
+    take_before = (idx == len(dates)) | ((idx > 0) & (targets - dates[before] <= dates[after] - targets))
+    nearest = np.where(take_before, before, after)
+    return nearest, np.abs((dates[nearest] - targets) // np.timedelta64(1, 'D'))
+
+def _bond_prices(yields: np.ndarray) -> np.ndarray:
+    """以簡化公式批次計算債券價格（殖利率限制於0.5%-8.0%，價格取小數點後2位）"""
+    clipped_yields = np.clip(yields, 0.5, 8.0)
+    return np.round(100.0 / (1 + clipped_yields / 100), 2)
+
+# ============================================================================
+# 圖表快取 - 相同計算結果切換標籤或重跑時直接取用已建立的圖表規格
+# ============================================================================
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_strategy_comparison_chart(va_rebalance_df: pd.DataFrame, dca_df: pd.DataFrame,
+                                      chart_type: str = "cumulative_value"):
+    """建立兩種策略的比較圖"""
+    from ..models.chart_visualizer import create_strategy_comparison_chart
+    
+    return create_strategy_comparison_chart(
+        va_rebalance_df=va_rebalance_df,
+        va_nosell_df=None,  # 簡化版本不顯示NoSell策略
+        dca_df=dca_df,
+        chart_type=chart_type
+    )
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_mobile_growth_figure(va_rebalance_df: pd.DataFrame, dca_df: pd.DataFrame):
+    """建立移動端簡化成長軌跡圖（plotly，較小高度與水平圖例）"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    
+    # VA線條
+    fig.add_trace(go.Scatter(
+        x=va_rebalance_df.index,
+        y=va_rebalance_df['Cum_Value'],
+        mode='lines',
+        name='🎯 定期定值 (VA)',
+        line=dict(color='#3b82f6', width=3)
+    ))
+    
+    # DCA線條
+    fig.add_trace(go.Scatter(
+        x=dca_df.index,
+        y=dca_df['Cum_Value'],
+        mode='lines',
+        name='💰 定期定額 (DCA)',
+        line=dict(color='#10b981', width=3)
+    ))
+    
+    # 移動端優化設定
+    fig.update_layout(
+        height=300,  # 較小高度
+        margin=dict(l=20, r=20, t=40, b=20),
+        font=dict(size=12),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        xaxis_title="投資期數",
+        yaxis_title="投資價值 ($)",
+        hovermode='x unified'
+    )
+    
+    return fig
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_return_bar_chart(summary_df: pd.DataFrame):
+    """建立年化報酬率比較柱狀圖"""
+    from ..models.chart_visualizer import create_bar_chart
+    
+    return create_bar_chart(
+        data_df=summary_df,
+        x_field="Annualized_Return",
+        y_field="Strategy",
+        color_field="Strategy",
+        title="年化報酬率比較"
+    )
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_risk_return_scatter(summary_df: pd.DataFrame):
+    """建立風險收益散點圖"""
+    from ..models.chart_visualizer import create_risk_return_scatter
+    
+    return create_risk_return_scatter(summary_df)
+
+# 以下圖表快取序列化後的Vega-Lite規格，重跑時以st.vega_lite_chart直接渲染，省去Altair的to_dict
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_investment_flow_spec(va_rebalance_df: pd.DataFrame) -> Dict[str, Any]:
+    """建立VA策略投資流圖表規格"""
+    from ..models.chart_visualizer import create_investment_flow_chart
+    
+    return create_investment_flow_chart(va_rebalance_df).to_dict()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_dca_flow_spec(dca_df: pd.DataFrame) -> Dict[str, Any]:
+    """建立DCA策略投資流圖表規格（DCA每期皆為買入）"""
+    import altair as alt
+    
+    flow_df = dca_df.copy()
+    
+    # DCA策略使用Fixed_Investment欄位作為投資金額
+    if "Fixed_Investment" in flow_df.columns:
+        flow_df["Invested"] = flow_df["Fixed_Investment"]
+    else:
+        # 降級處理：如果沒有Fixed_Investment欄位，使用計算方式
+        if len(flow_df) > 1:
+            # 計算每期投資金額
+            flow_df["Invested"] = flow_df["Cum_Inv"].diff().fillna(flow_df["Cum_Inv"].iloc[0])
+        else:
+            flow_df["Invested"] = flow_df.get("Cum_Inv", 0)
+    flow_df["Investment_Type"] = "Buy"
+    
+    # 確保Period欄位存在
+    if "Period" not in flow_df.columns:
+        flow_df["Period"] = range(len(flow_df))
+    
+    return alt.Chart(flow_df).mark_bar().encode(
+        x=alt.X("Period:Q", title="Period"),
+        y=alt.Y("Invested:Q", title="Investment Amount ($)"),
+        color=alt.Color(
+            "Investment_Type:N",
+            scale=alt.Scale(
+                domain=["Buy"],
+                range=["green"]
+            ),
+            title="Action"
+        ),
+        tooltip=["Period", "Invested", "Investment_Type"]
+    ).properties(
+        title="DCA Strategy Investment Flow",
+        width=400,
+        height=300
+    ).to_dict()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_allocation_pie_spec(stock_ratio: float, bond_ratio: float) -> Dict[str, Any]:
+    """建立資產配置圓餅圖規格"""
+    from ..models.chart_visualizer import create_allocation_pie_chart
+    
+    return create_allocation_pie_chart(stock_ratio, bond_ratio).to_dict()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_drawdown_spec(va_rebalance_df: pd.DataFrame, dca_df: pd.DataFrame) -> Dict[str, Any]:
+    """建立VA與DCA回撤分析垂直合併圖表規格"""
+    import altair as alt
+    from ..models.chart_visualizer import create_drawdown_chart
+    
+    return alt.vconcat(
+        create_drawdown_chart(va_rebalance_df, "VA策略").properties(title="VA策略 回撤分析"),
+        create_drawdown_chart(dca_df, "DCA策略").properties(title="DCA策略 回撤分析")
+    ).resolve_scale(x='independent', y='independent').to_dict()
+
+# ============================================================================
+# 表格格式化與匯出快取 - 相同計算結果切換表格、重跑或重複下載時直接取用快取
+# ============================================================================
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _format_table(df: pd.DataFrame, table_type: str) -> pd.DataFrame:
+    """應用格式化規則 - 遵循第2章PERCENTAGE_PRECISION_RULES（只建立需變更的欄位，其餘沿用原表）"""
+    changes = {}
+    
+    # 應用百分比精度規則（符合規則的浮點欄位一次批次四捨五入）
+    precisions = {
+        col: PERCENTAGE_PRECISION_RULES[col]
+        for col in df.columns
+        if col in PERCENTAGE_PRECISION_RULES and df[col].dtype in ['float64', 'float32']
+    }
+    if precisions:
+        changes.update(df[list(precisions)].round(precisions).items())
+    
+    # 貨幣格式化
+    currency_columns = ["Cum_Value", "Cum_Inv", "Final_Value", "Total_Investment"]
+    for col in currency_columns:
+        if col in df.columns:
+            # 缺值遮罩一次算出，只格式化有值的元素再寫回物件陣列
+            values = changes[col] if col in changes else df[col]
+            valid = values.notna().to_numpy()
+            formatted = np.full(len(values), "", dtype=object)
+            formatted[valid] = [f"${value:,.0f}" for value in values.to_numpy()[valid]]
+            changes[col] = formatted
+    
+    return df.assign(**changes)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _serialize_csv(df: pd.DataFrame) -> bytes:
+    """將表格轉為CSV位元組（分批寫入緩衝區）- 相同表格重複下載時直接取用快取"""
+    buffer = io.BytesIO()
+    buffer.write(b'\xef\xbb\xbf')  # UTF-8 BOM，Excel開啟中文不亂碼
+    df.to_csv(buffer, index=False, encoding='utf-8', chunksize=10_000, lineterminator='\n')
+    return buffer.getvalue()
+
+@lru_cache(maxsize=8)
+def _ordered_columns(column_order: Tuple[str, ...], available_columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """依第2章欄位順序篩出表格實際存在的欄位 - 相同欄位組合只計算一次"""
+    column_set = frozenset(available_columns)
+    return tuple(col for col in column_order if col in column_set)
+
 # ============================================================================
 # 中央結果展示區域管理器
 # ============================================================================
@@ -240,6 +649,8 @@ class ResultsDisplayManager:
         self.tables_config = DATA_TABLES_CONFIG
         self.calculation_results = {}
         self.last_parameters = None
+        self._summary_rows = {}
+        self._summary_rows_source = None
         
     def render_complete_results_display(self, parameters: Dict[str, Any]):
         """渲染完整中央結果展示區域"""
@@ -247,12 +658,12 @@ class ResultsDisplayManager:
         if st.session_state.get('trigger_calculation', False):
             # 清除觸發標記
             st.session_state.trigger_calculation = False
+            st.session_state._calc_in_flight = False
             
             # 執行策略計算
             self._execute_strategy_calculations(parameters)
             
             # 記錄計算時間
-            from datetime import datetime
             st.session_state.last_calculation_time = datetime.now()
             
             # 顯示計算完成信息
@@ -278,6 +689,11 @@ class ResultsDisplayManager:
     
     def _execute_strategy_calculations(self, parameters: Dict[str, Any]):
         """執行策略計算 - 整合第2章計算引擎"""
+        # 參數與模擬狀態皆未改變時沿用上次結果，不重新取數與計算
+        if st.session_state.get("calculation_results") and st.session_state.get("last_calculation_key") == _calculation_key(parameters):
+            self.calculation_results = st.session_state.calculation_results
+            return
+        
         try:
             # 顯示計算進度
             progress_bar = st.progress(0)
@@ -290,66 +706,22 @@ class ResultsDisplayManager:
             # 從第1章API獲取真實市場數據
             market_data = self._fetch_real_market_data(parameters)
             
-            # 階段2：計算VA策略
-            status_text.text("🎯 階段2/4：計算VA策略...")
+            # 階段2：計算VA/DCA策略與比較分析（相同參數與市場數據直接取用快取）
+            status_text.text("🎯 階段2/4：計算VA與DCA策略...")
             progress_bar.progress(50)
             
-            # 轉換頻率格式（UI使用小寫，計算函數期望大寫開頭）
-            frequency_mapping = {
-               "monthly": "Monthly",
-               "quarterly": "Quarterly", 
-               "semi_annually": "Semi-annually",
-               "annually": "Annually"
-            }
-            calculation_frequency = frequency_mapping.get(parameters["investment_frequency"], "Annually")
-            
-            # VA策略計算
-            va_rebalance_df = calculate_va_strategy(
-               C0=parameters["initial_investment"],
-               annual_investment=parameters["annual_investment"],  # 使用正確的年度投入金額
-               annual_growth_rate=parameters["va_growth_rate"],  # 直接使用，不需要除以100
-               annual_inflation_rate=parameters["inflation_rate"],  # 直接使用，不需要除以100
-               investment_years=parameters["investment_years"],
-               frequency=calculation_frequency,  # 使用轉換後的頻率
-               stock_ratio=parameters["stock_ratio"],  # 直接使用，不需要除以100
-               strategy_type=parameters.get("strategy_type", "Rebalance"),  # 修正：使用用戶選擇的策略類型
-               market_data=market_data
-            )
-            
-            # 階段3：計算DCA策略
-            status_text.text("💰 階段3/4：計算DCA策略...")
-            progress_bar.progress(75)
-            
-            # DCA策略計算
-            dca_df = calculate_dca_strategy(
-               C0=parameters["initial_investment"],
-               annual_investment=parameters["annual_investment"],  # 使用正確的年度投入金額
-               annual_growth_rate=parameters["va_growth_rate"],  # 直接使用，不需要除以100
-               annual_inflation_rate=parameters["inflation_rate"],  # 直接使用，不需要除以100
-               investment_years=parameters["investment_years"],
-               frequency=calculation_frequency,  # 使用轉換後的頻率
-               stock_ratio=parameters["stock_ratio"],  # 直接使用，不需要除以100
-               market_data=market_data
-            )
+            va_rebalance_df, dca_df, summary_df = _calculate_strategies(parameters, market_data)
             
             # 階段4：生成比較分析
             status_text.text("📈 階段4/4：生成比較分析...")
             progress_bar.progress(100)
             
-            # 綜合比較指標
-            summary_df = calculate_summary_metrics(
-               va_rebalance_df=va_rebalance_df,
-               va_nosell_df=None,
-               dca_df=dca_df,
-               initial_investment=parameters["initial_investment"],
-               periods_per_year=parameters["periods_per_year"]
-            )
-            
             # 保存計算結果到實例變量和session_state
             self.calculation_results = {
                "va_rebalance_df": va_rebalance_df,
                "dca_df": dca_df,
                "summary_df": summary_df,
+               "summary_rows": _index_summary_rows(summary_df),  # 供卡片、指標與建議模組直接以策略名稱取列
                "parameters": parameters
             }
             
@@ -359,6 +731,12 @@ class ResultsDisplayManager:
             # 同時保存到session_state以便跨組件訪問
             st.session_state.calculation_results = self.calculation_results
             
+            # 計算後才記錄雜湊鍵，使自動產生的模擬種子一併納入
+            st.session_state.last_calculation_key = _calculation_key(parameters)
+            
+            # 新的計算結果使用新的匯出時間戳
+            st.session_state.pop("_export_ts", None)
+            
             # 清除進度顯示
             progress_bar.empty()
             status_text.empty()
@@ -373,6 +751,7 @@ class ResultsDisplayManager:
             st.error(f"計算過程中出現錯誤: {e}")
             self.calculation_results = {}
             st.session_state.calculation_results = {}
+            st.session_state.pop("last_calculation_key", None)
     
     def _fetch_real_market_data(self, parameters: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -388,11 +767,7 @@ class ResultsDisplayManager:
         """
         try:
             from src.data_sources import get_api_key
-            from src.data_sources.tiingo_client import TiingoDataFetcher
-            from src.data_sources.fred_client import FREDDataFetcher
             from src.data_sources.trading_calendar import generate_trading_days
-            from datetime import datetime, timedelta
-            import logging
             
             logger = logging.getLogger(__name__)
             
@@ -427,7 +802,6 @@ class ResultsDisplayManager:
             frequency = parameters.get("investment_frequency", "annually")
             
             # 使用 FREQUENCY_MAPPING 計算總期數
-            from src.models.calculation_formulas import FREQUENCY_MAPPING
             if frequency.lower() == "annually":
                periods_per_year = FREQUENCY_MAPPING["Annually"]["periods_per_year"]
             elif frequency.lower() == "quarterly":
@@ -464,9 +838,9 @@ class ResultsDisplayManager:
             # period_days = frequency_days.get(parameters["investment_frequency"], 90)
             # end_date = start_date + timedelta(days=total_periods * period_days)
             
-            # 修正後：使用實際期間計算確保覆蓋所有期間
-            from src.utils.trading_days import calculate_period_end_date
-            final_period_end = calculate_period_end_date(start_date, parameters["investment_frequency"], total_periods)
+            # 修正後：使用實際期間計算確保覆蓋所有期間（各期起訖日期一次向量化計算，最後一期期末即為涵蓋終點）
+            period_starts, period_ends = calculate_period_dates(start_date, parameters["investment_frequency"], total_periods)
+            final_period_end = period_ends[-1].to_pydatetime()
             
             # 為了確保有足夠的API數據，在最後期間結束日期基礎上再加6個月緩衝
             end_date = final_period_end + timedelta(days=180)
@@ -474,34 +848,26 @@ class ResultsDisplayManager:
             # 使用交易日調整函數
             trading_days = generate_trading_days(start_date, end_date)
             
-            market_data_list = []
-            
-            # 初始化API客戶端
-            tiingo_fetcher = None
-            fred_fetcher = None
+            start_date_str = start_date.strftime('%Y-%m-%d')
+            end_date_str = end_date.strftime('%Y-%m-%d')
             
-            if tiingo_api_key:
-               tiingo_fetcher = TiingoDataFetcher(tiingo_api_key)
-               logger.info("Tiingo API客戶端初始化成功")
+            # 兩個API互不相依，同時發出請求（相同日期範圍於快取TTL內不重複請求API）
+            executor_kwargs = {}
+            if get_script_run_ctx is not None:
+               executor_kwargs = {"initializer": add_script_run_ctx, "initargs": (None, get_script_run_ctx())}
             
-            if fred_api_key:
-               fred_fetcher = FREDDataFetcher(fred_api_key)
-               logger.info("FRED API客戶端初始化成功")
+            with ThreadPoolExecutor(max_workers=2, **executor_kwargs) as executor:
+               spy_future = executor.submit(_fetch_spy_prices, start_date_str, end_date_str) if tiingo_api_key else None
+               bond_future = executor.submit(_fetch_treasury_yields, start_date_str, end_date_str) if fred_api_key else None
             
             # 獲取股票價格數據
-            spy_data = {}
+            spy_dates, spy_values = _sorted_observations([], [])
             api_success = True
             
-            if tiingo_fetcher:
+            if spy_future is not None:
                try:
-                   spy_prices = tiingo_fetcher.get_spy_prices(
-                       start_date.strftime('%Y-%m-%d'),
-                       end_date.strftime('%Y-%m-%d')
-                   )
-                   for data_point in spy_prices:
-                       # 確保價格精度：小數點後2位
-                       spy_data[data_point.date] = round(data_point.spy_price, 2)
-                   logger.info(f"成功獲取 {len(spy_data)} 筆SPY價格數據")
+                   spy_dates, spy_values = spy_future.result()
+                   logger.info(f"成功獲取 {len(spy_dates)} 筆SPY價格數據")
                    
                except Exception as e:
                    logger.warning(f"Tiingo API獲取失敗: {str(e)}")
@@ -512,18 +878,11 @@ class ResultsDisplayManager:
                api_success = False
             
             # 獲取債券殖利率數據
-            bond_data = {}
-            if fred_fetcher:
+            bond_dates, bond_values = _sorted_observations([], [])
+            if bond_future is not None:
                try:
-                   bond_yields = fred_fetcher.get_treasury_yields(
-                       start_date.strftime('%Y-%m-%d'),
-                       end_date.strftime('%Y-%m-%d'),
-                       'DGS1'
-                   )
-                   for data_point in bond_yields:
-                       # 確保殖利率精度：小數點後4位
-                       bond_data[data_point.date] = round(data_point.bond_yield, 4)
-                   logger.info(f"成功獲取 {len(bond_data)} 筆債券殖利率數據")
+                   bond_dates, bond_values = bond_future.result()
+                   logger.info(f"成功獲取 {len(bond_dates)} 筆債券殖利率數據")
                    
                except Exception as e:
                    logger.warning(f"FRED API獲取失敗: {str(e)}")
@@ -541,33 +900,76 @@ class ResultsDisplayManager:
                return self._generate_fallback_data(parameters)
             
             # 如果用戶選擇真實數據但沒有獲取到API數據，直接返回錯誤
-            if data_source_mode == "real_data" and (len(spy_data) == 0 and len(bond_data) == 0):
+            if data_source_mode == "real_data" and (len(spy_dates) == 0 and len(bond_dates) == 0):
                logger.error("用戶選擇真實數據但未獲取到任何API數據")
                st.error("❌ 無法獲取指定期間的真實市場數據")
                st.info("💡 請檢查日期範圍或切換到模擬數據模式")
                return self._generate_fallback_data(parameters)
             
+            # 隨機擾動以固定種子一次向量化產生，期間迴圈內僅以期數索引取用
+            rng = np.random.default_rng(42)
+            spy_overnight_changes = np.clip(rng.normal(0, 0.005, total_periods), -0.01, 0.01)  # 0.5%標準差，限制在±1%
+            bond_overnight_changes = np.clip(rng.normal(0, 0.02, total_periods), -0.001, 0.001)  # 2個基點標準差，限制在±0.1%
+            gap_stock_returns = rng.normal(0.02, 0.10, total_periods)  # 真實數據缺漏時的期末股價波動
+            gap_bond_yield_changes = rng.normal(0, 0.15, total_periods)  # 真實數據缺漏時的期末殖利率波動
+            sim_rng = np.random.default_rng(42 + int(start_date.timestamp()) % 1000)
+            sim_shocks = sim_rng.standard_normal(total_periods)  # 模擬期間幾何布朗運動的標準常態衝擊
+            sim_bond_yield_changes = sim_rng.normal(0, 0.1, total_periods)
+            
+            # 各欄位預先配置陣列，迴圈內以索引填值，最後一次建立DataFrame
+            spy_price_origins = np.empty(total_periods)
+            spy_price_ends = np.empty(total_periods)
+            bond_yield_origins = np.empty(total_periods)
+            bond_yield_ends = np.empty(total_periods)
+            
             # 生成期間數據
-            from src.utils.trading_days import calculate_period_start_date, calculate_period_end_date
+            date_origins = period_starts.strftime('%Y-%m-%d').to_numpy(dtype=object)
+            date_ends = period_ends.strftime('%Y-%m-%d').to_numpy(dtype=object)
             
             # 價格連續性追蹤變量 - 解決混合數據價格跳躍問題
             previous_spy_price_end = None
             previous_bond_yield_end = None
             
-            # 檢測真實數據可用範圍
+            # 各期起訖日期最接近的觀測一次以向量化二分搜尋求得，迴圈內僅以期數索引取用
+            period_start_days = period_starts.to_numpy().astype('datetime64[D]')
+            period_end_days = period_ends.to_numpy().astype('datetime64[D]')
+            spy_origin_idx, spy_origin_diff = _nearest_observations(spy_dates, period_start_days)
+            spy_end_idx, spy_end_diff = _nearest_observations(spy_dates, period_end_days)
+            bond_origin_idx, bond_origin_diff = _nearest_observations(bond_dates, period_start_days)
+            bond_end_idx, bond_end_diff = _nearest_observations(bond_dates, period_end_days)
+            
+            # 檢測真實數據可用範圍（期初日期不晚於今天的期間才有真實數據）
             current_date = datetime.now().date()
+            real_data_available = period_start_days <= np.datetime64(current_date, 'D')
             real_data_cutoff_period = None
             
+            # 模擬期間的期間報酬率與迴圈無關，一次計算
+            # 計算期間時間參數 - 確保與parameter頻率格式一致
+            freq_lower = parameters.get("investment_frequency", "annually").lower()
+            if freq_lower == 'monthly':
+               dt = 1/12
+            elif freq_lower == 'quarterly':
+               dt = 1/4
+            elif freq_lower == 'semi_annually':
+               dt = 1/2
+            else:  # annually
+               dt = 1
+            
+            # 使用長期股市成長預期：年化7-10%（歷史S&P 500平均）
+            # 而非每期隨機決定牛熊市
+            base_annual_return = 0.085  # 8.5%年化報酬率（歷史平均）
+            annual_volatility = 0.16  # 16%年化波動率（歷史平均）
+            
+            # 加入週期性調整（基於期間位置的緩慢變化）
+            cycle_adjustments = 0.02 * np.sin(2 * np.pi * np.arange(total_periods) / (total_periods / 3))  # 3個大週期
+            adjusted_annual_returns = base_annual_return + cycle_adjustments
+            
+            # 使用幾何布朗運動計算期間報酬率
+            sim_period_returns = (adjusted_annual_returns - annual_volatility**2/2) * dt + annual_volatility * np.sqrt(dt) * sim_shocks
+            
             for period in range(total_periods):
-               # 使用正確的投資頻率計算日期 - 修正：不再使用固定30天間隔
-               period_start = calculate_period_start_date(start_date, parameters["investment_frequency"], period + 1)
-               period_end = calculate_period_end_date(start_date, parameters["investment_frequency"], period + 1)
-               
-               date_str = period_start.strftime('%Y-%m-%d')
-               end_date_str = period_end.strftime('%Y-%m-%d')
-               
                # 判斷是否進入模擬數據範圍
-               is_real_data_available = period_start.date() <= current_date
+               is_real_data_available = bool(real_data_available[period])
                
                # 記錄真實數據截止期間
                if is_real_data_available and real_data_cutoff_period is None:
@@ -581,67 +983,39 @@ class ResultsDisplayManager:
                # 價格連續性處理 - 統一處理真實數據和模擬數據的連續性
                if period == 0:
                    # 第一期：直接使用真實數據或預設值
-                   if is_real_data_available and len(spy_data) > 0:
-                       closest_spy_date = min(spy_data.keys(), key=lambda x: abs((datetime.strptime(x, '%Y-%m-%d') - period_start).days), default=None)
-                       spy_price_origin = spy_data.get(closest_spy_date) if closest_spy_date else None
-                       if spy_price_origin is None:
-                           spy_price_origin = list(spy_data.values())[-1] if spy_data else 400.0
+                   if is_real_data_available and len(spy_dates) > 0:
+                       spy_price_origin = float(spy_values[spy_origin_idx[period]])
                    else:
                        spy_price_origin = 400.0  # 預設起始價格
                    
-                   if is_real_data_available and len(bond_data) > 0:
-                       closest_bond_date = min(bond_data.keys(), key=lambda x: abs((datetime.strptime(x, '%Y-%m-%d') - period_start).days), default=None)
-                       bond_yield_origin = bond_data.get(closest_bond_date) if closest_bond_date else None
-                       if bond_yield_origin is None:
-                           bond_yield_origin = list(bond_data.values())[-1] if bond_data else 3.0
+                   if is_real_data_available and len(bond_dates) > 0:
+                       bond_yield_origin = float(bond_values[bond_origin_idx[period]])
                    else:
                        bond_yield_origin = 3.0  # 預設起始殖利率
                else:
                    # 第二期開始：優先使用真實API數據，只在無法獲取時才使用相依性機制
-                   if is_real_data_available and len(spy_data) > 0:
+                   if is_real_data_available and len(spy_dates) > 0:
                        # 真實數據期間：直接使用API數據，但需要檢查日期範圍合理性
-                       closest_spy_date = min(spy_data.keys(), key=lambda x: abs((datetime.strptime(x, '%Y-%m-%d') - period_start).days), default=None)
+                       spy_idx, date_diff = spy_origin_idx[period], spy_origin_diff[period]
                        
                        # 修正：檢查匹配的日期是否在合理範圍內（30天內）
-                       if closest_spy_date:
-                           date_diff = abs((datetime.strptime(closest_spy_date, '%Y-%m-%d') - period_start).days)
-                           if date_diff <= 30:
-                               # 在合理範圍內，使用API數據
-                               spy_price_origin = spy_data.get(closest_spy_date)
-                               if spy_price_origin is None:
-                                   spy_price_origin = list(spy_data.values())[-1] if spy_data else 400.0
-                               logger.debug(f"期間{period}：使用真實API數據，期初價格{spy_price_origin}，匹配日期{closest_spy_date}（差異{date_diff}天）")
-                           else:
-                               # 超出合理範圍，表示API數據不足，使用連續性邏輯
-                               if previous_spy_price_end is not None:
-                                   import numpy as np
-                                   np.random.seed(42 + period * 23)
-                                   overnight_change = np.random.normal(0, 0.005)
-                                   overnight_change = max(-0.01, min(0.01, overnight_change))
-                                   spy_price_origin = round(previous_spy_price_end * (1 + overnight_change), 2)
-                                   logger.debug(f"期間{period}：API數據超出範圍（差異{date_diff}天），使用連續性邏輯，期初價格{spy_price_origin}")
-                               else:
-                                   spy_price_origin = 400.0
-                                   logger.debug(f"期間{period}：API數據超出範圍且無前期數據，使用預設價格{spy_price_origin}")
+                       if date_diff <= 30:
+                           # 在合理範圍內，使用API數據
+                           spy_price_origin = float(spy_values[spy_idx])
+                           logger.debug(f"期間{period}：使用真實API數據，期初價格{spy_price_origin}，匹配日期{spy_dates[spy_idx]}（差異{date_diff}天）")
                        else:
-                           # 沒有找到匹配日期，使用連續性邏輯
+                           # 超出合理範圍，表示API數據不足，使用連續性邏輯
                            if previous_spy_price_end is not None:
-                               import numpy as np
-                               np.random.seed(42 + period * 23)
-                               overnight_change = np.random.normal(0, 0.005)
-                               overnight_change = max(-0.01, min(0.01, overnight_change))
+                               overnight_change = float(spy_overnight_changes[period])
                                spy_price_origin = round(previous_spy_price_end * (1 + overnight_change), 2)
-                               logger.debug(f"期間{period}：無API匹配日期，使用連續性邏輯，期初價格{spy_price_origin}")
+                               logger.debug(f"期間{period}：API數據超出範圍（差異{date_diff}天），使用連續性邏輯，期初價格{spy_price_origin}")
                            else:
                                spy_price_origin = 400.0
+                               logger.debug(f"期間{period}：API數據超出範圍且無前期數據，使用預設價格{spy_price_origin}")
                    elif previous_spy_price_end is not None:
                        # 模擬數據期間：基於前期期末價格加入隔夜變動
-                       import numpy as np
-                       np.random.seed(42 + period * 23)  # 確保可重現的隔夜變動
-                       
                        # 隔夜價格變動：通常在-1%到+1%之間
-                       overnight_change = np.random.normal(0, 0.005)  # 0.5%標準差
-                       overnight_change = max(-0.01, min(0.01, overnight_change))  # 限制在±1%
+                       overnight_change = float(spy_overnight_changes[period])
                        
                        spy_price_origin = round(previous_spy_price_end * (1 + overnight_change), 2)
                        logger.debug(f"期間{period}：模擬數據期間，基於前期期末價格{previous_spy_price_end}，加入{overnight_change:.4f}隔夜變動，期初價格{spy_price_origin}")
@@ -649,50 +1023,28 @@ class ResultsDisplayManager:
                        # 最後備用方案
                        spy_price_origin = 400.0
                    
-                   if is_real_data_available and len(bond_data) > 0:
+                   if is_real_data_available and len(bond_dates) > 0:
                        # 真實數據期間：直接使用API數據，但需要檢查日期範圍合理性
-                       closest_bond_date = min(bond_data.keys(), key=lambda x: abs((datetime.strptime(x, '%Y-%m-%d') - period_start).days), default=None)
+                       bond_idx, date_diff = bond_origin_idx[period], bond_origin_diff[period]
                        
                        # 修正：檢查匹配的日期是否在合理範圍內（30天內）
-                       if closest_bond_date:
-                           date_diff = abs((datetime.strptime(closest_bond_date, '%Y-%m-%d') - period_start).days)
-                           if date_diff <= 30:
-                               # 在合理範圍內，使用API數據
-                               bond_yield_origin = bond_data.get(closest_bond_date)
-                               if bond_yield_origin is None:
-                                   bond_yield_origin = list(bond_data.values())[-1] if bond_data else 3.0
-                               logger.debug(f"期間{period}：使用真實API債券數據，期初殖利率{bond_yield_origin}，匹配日期{closest_bond_date}（差異{date_diff}天）")
-                           else:
-                               # 超出合理範圍，使用連續性邏輯
-                               if previous_bond_yield_end is not None:
-                                   import numpy as np
-                                   np.random.seed(42 + period * 29)
-                                   overnight_yield_change = np.random.normal(0, 0.02)
-                                   overnight_yield_change = max(-0.001, min(0.001, overnight_yield_change))
-                                   bond_yield_origin = round(max(0.5, min(8.0, previous_bond_yield_end + overnight_yield_change)), 4)
-                                   logger.debug(f"期間{period}：債券API數據超出範圍（差異{date_diff}天），使用連續性邏輯，期初殖利率{bond_yield_origin}")
-                               else:
-                                   bond_yield_origin = 3.0
-                                   logger.debug(f"期間{period}：債券API數據超出範圍且無前期數據，使用預設殖利率{bond_yield_origin}")
+                       if date_diff <= 30:
+                           # 在合理範圍內，使用API數據
+                           bond_yield_origin = float(bond_values[bond_idx])
+                           logger.debug(f"期間{period}：使用真實API債券數據，期初殖利率{bond_yield_origin}，匹配日期{bond_dates[bond_idx]}（差異{date_diff}天）")
                        else:
-                           # 沒有找到匹配日期，使用連續性邏輯
+                           # 超出合理範圍，使用連續性邏輯
                            if previous_bond_yield_end is not None:
-                               import numpy as np
-                               np.random.seed(42 + period * 29)
-                               overnight_yield_change = np.random.normal(0, 0.02)
-                               overnight_yield_change = max(-0.001, min(0.001, overnight_yield_change))
+                               overnight_yield_change = float(bond_overnight_changes[period])
                                bond_yield_origin = round(max(0.5, min(8.0, previous_bond_yield_end + overnight_yield_change)), 4)
-                               logger.debug(f"期間{period}：無債券API匹配日期，使用連續性邏輯，期初殖利率{bond_yield_origin}")
+                               logger.debug(f"期間{period}：債券API數據超出範圍（差異{date_diff}天），使用連續性邏輯，期初殖利率{bond_yield_origin}")
                            else:
                                bond_yield_origin = 3.0
+                               logger.debug(f"期間{period}：債券API數據超出範圍且無前期數據，使用預設殖利率{bond_yield_origin}")
                    elif previous_bond_yield_end is not None:
                        # 模擬數據期間：基於前期期末殖利率加入隔夜變動
-                       import numpy as np
-                       np.random.seed(42 + period * 29)  # 不同種子避免與股價同步
-                       
                        # 殖利率隔夜變動：通常很小，在-0.1%到+0.1%之間
-                       overnight_yield_change = np.random.normal(0, 0.02)  # 2個基點標準差
-                       overnight_yield_change = max(-0.001, min(0.001, overnight_yield_change))  # 限制在±0.1%
+                       overnight_yield_change = float(bond_overnight_changes[period])
                        
                        bond_yield_origin = round(max(0.5, min(8.0, previous_bond_yield_end + overnight_yield_change)), 4)
                        logger.debug(f"期間{period}：模擬數據期間，基於前期期末殖利率{previous_bond_yield_end}，加入{overnight_yield_change:.4f}隔夜變動，期初殖利率{bond_yield_origin}")
@@ -700,77 +1052,43 @@ class ResultsDisplayManager:
                        # 最後備用方案
                        bond_yield_origin = 3.0
                
-               # 債券價格計算（簡化公式）
-               bond_price_origin = round(100.0 / (1 + bond_yield_origin/100), 2)
-               
                # 生成期末價格 - 優先使用真實API數據
-               import numpy as np
-               
                if is_real_data_available:
                    # 真實數據期間：嘗試使用API數據
-                   if len(spy_data) > 0:
+                   if len(spy_dates) > 0:
                        # 找最接近期末日期的SPY價格
-                       closest_spy_end_date = min(spy_data.keys(), key=lambda x: abs((datetime.strptime(x, '%Y-%m-%d') - period_end).days), default=None)
-                       if closest_spy_end_date and abs((datetime.strptime(closest_spy_end_date, '%Y-%m-%d') - period_end).days) <= 30:
+                       if spy_end_diff[period] <= 30:
                            # 如果找到30天內的數據，使用真實數據
-                           spy_price_end = spy_data[closest_spy_end_date]
+                           spy_price_end = float(spy_values[spy_end_idx[period]])
                            logger.debug(f"期間{period}：使用真實API期末數據，期末價格{spy_price_end}")
                        else:
                            # 如果沒有找到接近的數據，使用小幅波動模擬
-                           np.random.seed(42 + period)
-                           stock_return = np.random.normal(0.02, 0.10)  # 10%波動
+                           stock_return = float(gap_stock_returns[period])  # 10%波動
                            spy_price_end = round(spy_price_origin * (1 + stock_return), 2)
                            logger.debug(f"期間{period}：無法找到合適的真實期末數據，使用模擬波動，期末價格{spy_price_end}")
                    else:
                        # 沒有SPY數據，使用模擬
-                       np.random.seed(42 + period)
-                       stock_return = np.random.normal(0.02, 0.10)
+                       stock_return = float(gap_stock_returns[period])
                        spy_price_end = round(spy_price_origin * (1 + stock_return), 2)
                    
                    # 債券殖利率期末數據
-                   if len(bond_data) > 0:
-                       closest_bond_end_date = min(bond_data.keys(), key=lambda x: abs((datetime.strptime(x, '%Y-%m-%d') - period_end).days), default=None)
-                       if closest_bond_end_date and abs((datetime.strptime(closest_bond_end_date, '%Y-%m-%d') - period_end).days) <= 30:
-                           bond_yield_end = bond_data[closest_bond_end_date]
+                   if len(bond_dates) > 0:
+                       if bond_end_diff[period] <= 30:
+                           bond_yield_end = float(bond_values[bond_end_idx[period]])
                            logger.debug(f"期間{period}：使用真實API債券期末數據，期末殖利率{bond_yield_end}")
                        else:
-                           bond_yield_change = np.random.normal(0, 0.15)
+                           bond_yield_change = float(gap_bond_yield_changes[period])
                            bond_yield_end = round(max(0.5, min(8.0, bond_yield_origin + bond_yield_change)), 4)
                            logger.debug(f"期間{period}：無法找到合適的真實債券期末數據，使用模擬波動")
                    else:
-                       bond_yield_change = np.random.normal(0, 0.15)
+                       bond_yield_change = float(gap_bond_yield_changes[period])
                        bond_yield_end = round(max(0.5, min(8.0, bond_yield_origin + bond_yield_change)), 4)
                else:
                    # 模擬數據期間：使用與_generate_fallback_data相同的市場週期邏輯
                    # 修正：需要在函數開始時預先生成市場週期，而非在此處重新生成
                    # 這裡改為使用簡化但連續的模擬邏輯，確保價格連續性
-                   base_seed = 42
-                   np.random.seed(base_seed + period * 17 + int(start_date.timestamp()) % 1000)
-                   
-                   # 使用連續性保證的長期成長模型
-                   # 計算期間時間參數 - 確保與parameter頻率格式一致
-                   freq_lower = parameters.get("investment_frequency", "annually").lower()
-                   if freq_lower == 'monthly':
-                       dt = 1/12
-                   elif freq_lower == 'quarterly':
-                       dt = 1/4
-                   elif freq_lower == 'semi_annually':
-                       dt = 1/2
-                   else:  # annually
-                       dt = 1
-                   
-                   # 使用長期股市成長預期：年化7-10%（歷史S&P 500平均）
-                   # 而非每期隨機決定牛熊市
-                   base_annual_return = 0.085  # 8.5%年化報酬率（歷史平均）
-                   annual_volatility = 0.16  # 16%年化波動率（歷史平均）
-                   
-                   # 加入週期性調整（基於期間位置的緩慢變化）
-                   cycle_adjustment = 0.02 * np.sin(2 * np.pi * period / (total_periods / 3))  # 3個大週期
-                   adjusted_annual_return = base_annual_return + cycle_adjustment
-                   
-                   # 使用幾何布朗運動計算期間報酬率
-                   Z = np.random.normal(0, 1)
-                   period_return = (adjusted_annual_return - annual_volatility**2/2) * dt + annual_volatility * np.sqrt(dt) * Z
+                   # 使用連續性保證的長期成長模型（期間報酬率已於迴圈前算好）
+                   period_return = float(sim_period_returns[period])
                    spy_price_end = round(spy_price_origin * (1 + period_return), 2)
                    
                    # 確保價格變化在合理範圍內
@@ -781,7 +1099,7 @@ class ResultsDisplayManager:
                        logger.debug(f"期間{period}：限制股價變化幅度至35%，從{spy_price_origin}變為{spy_price_end}")
                    
                    # 債券殖利率：較小的波動
-                   bond_yield_change = np.random.normal(0, 0.1)
+                   bond_yield_change = float(sim_bond_yield_changes[period])
                    bond_yield_end = round(max(0.5, min(8.0, bond_yield_origin + bond_yield_change)), 4)
                    
                    # 確保殖利率變化在合理範圍內
@@ -791,34 +1109,39 @@ class ResultsDisplayManager:
                        bond_yield_end = round(max(0.5, min(8.0, bond_yield_origin * (1 + max_yield_change))), 4)
                        logger.debug(f"期間{period}：限制殖利率變化幅度至25%，從{bond_yield_origin}變為{bond_yield_end}")
                
-               bond_price_end = round(100.0 / (1 + bond_yield_end/100), 2)
-               
-               market_data_list.append({
-                   'Period': period,
-                   'Date_Origin': date_str,
-                   'Date_End': end_date_str,
-                   'SPY_Price_Origin': spy_price_origin,
-                   'SPY_Price_End': spy_price_end,
-                   'Bond_Yield_Origin': bond_yield_origin,
-                   'Bond_Yield_End': bond_yield_end,
-                   'Bond_Price_Origin': bond_price_origin,
-                   'Bond_Price_End': bond_price_end
-               })
+               spy_price_origins[period] = spy_price_origin
+               spy_price_ends[period] = spy_price_end
+               bond_yield_origins[period] = bond_yield_origin
+               bond_yield_ends[period] = bond_yield_end
                
                # 更新連續性追蹤變量
                previous_spy_price_end = spy_price_end
                previous_bond_yield_end = bond_yield_end
             
-            # 創建DataFrame
-            market_data = pd.DataFrame(market_data_list)
+            # 債券價格計算（簡化公式，整段一次計算）
+            bond_price_origins = _bond_prices(bond_yield_origins)
+            bond_price_ends = _bond_prices(bond_yield_ends)
+            
+            # 創建DataFrame（各欄已是定型陣列，直接引用不另行複製）
+            market_data = pd.DataFrame({
+               'Period': np.arange(total_periods, dtype=np.int64),
+               'Date_Origin': date_origins,
+               'Date_End': date_ends,
+               'SPY_Price_Origin': spy_price_origins,
+               'SPY_Price_End': spy_price_ends,
+               'Bond_Yield_Origin': bond_yield_origins,
+               'Bond_Yield_End': bond_yield_ends,
+               'Bond_Price_Origin': bond_price_origins,
+               'Bond_Price_End': bond_price_ends
+            }, copy=False)
             
             # 顯示最終數據源狀態
-            if len(spy_data) > 0 or len(bond_data) > 0:
+            if len(spy_dates) > 0 or len(bond_dates) > 0:
                data_summary = []
-               if len(spy_data) > 0:
-                   data_summary.append(f"📈 SPY股票: {len(spy_data)} 筆")
-               if len(bond_data) > 0:
-                   data_summary.append(f"📊 債券殖利率: {len(bond_data)} 筆")
+               if len(spy_dates) > 0:
+                   data_summary.append(f"📈 SPY股票: {len(spy_dates)} 筆")
+               if len(bond_dates) > 0:
+                   data_summary.append(f"📊 債券殖利率: {len(bond_dates)} 筆")
                
                if real_data_cutoff_period is not None:
                    st.success(f"✅ 已成功使用混合數據生成 {len(market_data)} 期投資數據")
@@ -872,13 +1195,6 @@ class ResultsDisplayManager:
         2. 完整時間軸生成架構
         3. 幾何布朗運動價格生成
         """
-        # 導入必要模組
-        import numpy as np
-        from src.utils.trading_days import calculate_period_start_date, calculate_period_end_date
-        from src.utils.logger import get_component_logger
-        import time
-        from datetime import datetime
-        
         logger = get_component_logger("ResultsDisplay")
         logger.info("生成備用模擬數據 - 優化：更接近美國股市歷史特徵")
         
@@ -911,7 +1227,6 @@ class ResultsDisplayManager:
         frequency = parameters.get("investment_frequency", "annually")
         
         # 使用 FREQUENCY_MAPPING 計算總期數
-        from src.models.calculation_formulas import FREQUENCY_MAPPING
         if frequency.lower() == "annually":
             periods_per_year = FREQUENCY_MAPPING["Annually"]["periods_per_year"]
         elif frequency.lower() == "quarterly":
@@ -959,7 +1274,7 @@ class ResultsDisplayManager:
         # 生成市場週期
         def generate_market_cycles():
             """生成市場週期序列 - 優化：更接近美國股市歷史特徵"""
-            np.random.seed(base_seed)
+            cycle_rng = np.random.default_rng(base_seed)
             cycles = []
             remaining_periods = total_periods
             is_first_cycle = True
@@ -967,47 +1282,47 @@ class ResultsDisplayManager:
             
             while remaining_periods > 0:
                 # 決定市場類型
-                is_bull_market = np.random.random() < bull_market_probability
+                is_bull_market = cycle_rng.random() < bull_market_probability
                 
                 if is_bull_market:
                     # 牛市：年化報酬率8%-20%，波動率15%-20%，持續2-5年（嚴格遵循需求文件規格）
-                    annual_return = np.random.uniform(0.08, 0.20)
+                    annual_return = cycle_rng.uniform(0.08, 0.20)
                     
                     # 波動率動態調整：市場轉換期增加波動率
                     if previous_cycle_type == 'bear':
                         # 熊轉牛初期：波動率較高
-                        annual_volatility = np.random.uniform(0.18, 0.25) * volatility_multiplier
+                        annual_volatility = cycle_rng.uniform(0.18, 0.25) * volatility_multiplier
                     else:
                         # 正常牛市期間
-                        annual_volatility = np.random.uniform(0.15, 0.20) * volatility_multiplier
+                        annual_volatility = cycle_rng.uniform(0.15, 0.20) * volatility_multiplier
                     
-                    duration_years = np.random.uniform(2, 5)
+                    duration_years = cycle_rng.uniform(2, 5)
                     market_type = 'bull'
                     
                 else:
                     # 熊市：年化報酬率-15%～ -2%，波動率25%-35%，持續1-2年（嚴格遵循需求文件規格）
                     # 基本熊市報酬率：-15% ~ -2%（純負報酬，無正報酬可能）
-                    base_return = np.random.uniform(-0.15, -0.02)
+                    base_return = cycle_rng.uniform(-0.15, -0.02)
                     
                     # 極端事件：5-10%機率出現-30%以上年度跌幅
                     extreme_event_probability = 0.075  # 7.5%機率
-                    if np.random.random() < extreme_event_probability:
+                    if cycle_rng.random() < extreme_event_probability:
                         # 極端熊市：-35% ~ -30%
-                        annual_return = np.random.uniform(-0.35, -0.30)
+                        annual_return = cycle_rng.uniform(-0.35, -0.30)
                         # 極端事件期間波動率急劇上升
-                        annual_volatility = np.random.uniform(0.35, 0.45) * volatility_multiplier
+                        annual_volatility = cycle_rng.uniform(0.35, 0.45) * volatility_multiplier
                         logger.info(f"模擬極端熊市事件：年化報酬率{annual_return:.2%}，波動率{annual_volatility:.2%}")
                     else:
                         annual_return = base_return
                         # 波動率動態調整：熊市初期急劇上升
                         if previous_cycle_type == 'bull':
                             # 牛轉熊初期：波動率急劇上升
-                            annual_volatility = np.random.uniform(0.30, 0.40) * volatility_multiplier
+                            annual_volatility = cycle_rng.uniform(0.30, 0.40) * volatility_multiplier
                         else:
                             # 正常熊市期間
-                            annual_volatility = np.random.uniform(0.25, 0.35) * volatility_multiplier
+                            annual_volatility = cycle_rng.uniform(0.25, 0.35) * volatility_multiplier
                     
-                    duration_years = np.random.uniform(1, 2)
+                    duration_years = cycle_rng.uniform(1, 2)
                     market_type = 'bear'
                 
                 duration_periods = min(int(duration_years * periods_per_year), remaining_periods)
@@ -1033,15 +1348,27 @@ class ResultsDisplayManager:
             
             return cycles
         
+        # 各期起訖日期與日期字串一次計算
+        period_starts, period_ends = calculate_period_dates(start_date, frequency, total_periods)
+        date_origins = period_starts.strftime('%Y-%m-%d').to_numpy(dtype=object)
+        date_ends = period_ends.strftime('%Y-%m-%d').to_numpy(dtype=object)
+        
+        # 計算期間時間參數（股價與債券模擬共用）
+        if frequency == 'monthly':
+            dt = 1/12
+        elif frequency == 'quarterly':
+            dt = 1/4
+        elif frequency == 'semi-annually':
+            dt = 1/2
+        else:  # annually
+            dt = 1
+        
         # 生成完整時間軸
         def generate_simulation_timeline():
             """生成完整的模擬時間軸"""
             timeline = []
             
-            for period in range(1, total_periods + 1):
-                period_start_date = calculate_period_start_date(start_date, frequency, period)
-                period_end_date = calculate_period_end_date(start_date, frequency, period)
-                
+            for period, (period_start_date, period_end_date) in enumerate(zip(period_starts, period_ends), start=1):
                 timeline.append({
                     'period': period,
                     'adjusted_start_date': period_start_date,
@@ -1051,7 +1378,7 @@ class ResultsDisplayManager:
             return timeline
         
         # 生成期間價格時間軸
-        def generate_period_price_timeline(period_info, base_price, previous_price):
+        def generate_period_price_timeline(period_info, base_price, previous_price, shock):
             """
             使用幾何布朗運動生成期間價格變化
             公式：S(t+1) = S(t) * exp((μ - σ²/2) * dt + σ * √dt * Z)
@@ -1059,16 +1386,6 @@ class ResultsDisplayManager:
             # 獲取當期市場週期參數
             current_cycle = market_cycles[current_cycle_index]
             
-            # 計算期間時間參數
-            if frequency == 'monthly':
-                dt = 1/12
-            elif frequency == 'quarterly':
-                dt = 1/4
-            elif frequency == 'semi-annually':
-                dt = 1/2
-            else:  # annually
-                dt = 1
-            
             # 幾何布朗運動參數
             mu = current_cycle['annual_return']  # 年化報酬率
             sigma = current_cycle['annual_volatility']  # 年化波動率
@@ -1080,7 +1397,7 @@ class ResultsDisplayManager:
                 period_start_price = base_price
             
             # 使用幾何布朗運動生成期末價格
-            Z = np.random.normal(0, 1)  # 標準常態分佈隨機數
+            Z = shock  # 標準常態分佈隨機數（預先產生）
             growth_factor = np.exp((mu - sigma**2/2) * dt + sigma * np.sqrt(dt) * Z)
             period_end_price = period_start_price * growth_factor
             
@@ -1118,8 +1435,12 @@ class ResultsDisplayManager:
         bond_base_yield = 3.0  # 債券基準殖利率
         bond_yield_volatility = 0.003  # 債券殖利率波動率
         
-        # 生成期間數據
-        market_data_list = []
+        # 生成期間數據（各欄位預先配置陣列，迴圈內以索引填值）
+        spy_price_origins = np.empty(total_periods)
+        spy_price_ends = np.empty(total_periods)
+        bond_yield_origins = np.empty(total_periods)
+        bond_yield_ends = np.empty(total_periods)
+        market_types = np.empty(total_periods, dtype=object)
         previous_spy_price_end = None
         previous_bond_yield_end = None
         current_cycle_index = 0
@@ -1130,10 +1451,40 @@ class ResultsDisplayManager:
         peak_price = None  # 記錄高點價格
         bear_market_triggered = False  # 熊市觸發標記
         
-        for period_idx, period_info in enumerate(timeline):
-            # 為每期設定不同的隨機種子
-            np.random.seed(base_seed + period_idx * 17 + int(start_date.timetuple().tm_yday))
+        # 各期隨機衝擊以單一產生器一次產生（種子結合起始日，確保可重現）
+        period_rng = np.random.default_rng(base_seed + int(start_date.timetuple().tm_yday))
+        stock_shocks = period_rng.standard_normal(total_periods)
+        bond_origin_shocks = period_rng.standard_normal(total_periods)
+        bond_end_shocks = period_rng.standard_normal(total_periods)
+        
+        # 生成債券殖利率 - 使用Vasicek模型簡化版
+        # 殖利率只依賴前期期末殖利率，與股價路徑無關，先以向量算好衝擊項再單獨遞推
+        mean_reversion_speed = 0.1
+        origin_yield_changes = bond_yield_volatility * np.sqrt(dt) * bond_origin_shocks
+        end_yield_changes = bond_yield_volatility * np.sqrt(dt) * bond_end_shocks
+        for period_idx in range(total_periods):
+            if period_idx == 0:
+                # 第一期：使用基準殖利率
+                bond_yield_origin = bond_base_yield + bond_yield_volatility * bond_origin_shocks[0]
+            else:
+                # 第二期開始：均值回歸 α(θ - r)dt + σ dW 的簡化版
+                yield_change = mean_reversion_speed * (bond_base_yield - previous_bond_yield_end) * dt
+                yield_change += origin_yield_changes[period_idx]
+                bond_yield_origin = previous_bond_yield_end + yield_change
             
+            # 殖利率合理性限制
+            bond_yield_origin = max(0.5, min(8.0, bond_yield_origin))
+            bond_yield_end = max(0.5, min(8.0, bond_yield_origin + end_yield_changes[period_idx]))
+            
+            # 殖利率精度控制：小數點後4位
+            bond_yield_origins[period_idx] = round(bond_yield_origin, 4)
+            bond_yield_ends[period_idx] = previous_bond_yield_end = round(bond_yield_end, 4)
+        
+        # 債券價格計算（簡化公式）
+        bond_price_origins = _bond_prices(bond_yield_origins)
+        bond_price_ends = _bond_prices(bond_yield_ends)
+        
+        for period_idx, period_info in enumerate(timeline):
             # 更新市場週期索引（傳統時間驅動）
             if current_cycle_remaining <= 0 and current_cycle_index < len(market_cycles) - 1:
                 current_cycle_index += 1
@@ -1168,85 +1519,41 @@ class ResultsDisplayManager:
                         peak_price = previous_spy_price_end
                         cumulative_decline_from_peak = 0.0
             
-            period = period_info['period']
-            date_str = period_info['adjusted_start_date'].strftime('%Y-%m-%d')
-            end_date_str = period_info['adjusted_end_date'].strftime('%Y-%m-%d')
-            
             # 生成股票價格 - 使用幾何布朗運動
             stock_price_data = generate_period_price_timeline(
                 period_info, 
                 stock_base_price, 
-                previous_spy_price_end
+                previous_spy_price_end,
+                stock_shocks[period_idx]
             )
             
             spy_price_origin = stock_price_data['period_start_price']
             spy_price_end = stock_price_data['period_end_price']
             
-            # 計算期間時間參數
-            if frequency == 'monthly':
-                dt = 1/12
-            elif frequency == 'quarterly':
-                dt = 1/4
-            elif frequency == 'semi-annually':
-                dt = 1/2
-            else:  # annually
-                dt = 1
-            
-            # 生成債券殖利率 - 使用Vasicek模型簡化版
-            if period == 1:
-                # 第一期：使用基準殖利率
-                bond_yield_origin = bond_base_yield + np.random.normal(0, bond_yield_volatility)
-            else:
-                # 第二期開始：均值回歸模型
-                if previous_bond_yield_end is not None:
-                    # 均值回歸：α(θ - r)dt + σ dW 的簡化版
-                    mean_reversion_speed = 0.1
-                    target_yield = bond_base_yield
-                    yield_change = mean_reversion_speed * (target_yield - previous_bond_yield_end) * dt
-                    yield_change += bond_yield_volatility * np.random.normal(0, np.sqrt(dt))
-                    
-                    bond_yield_origin = previous_bond_yield_end + yield_change
-                else:
-                    bond_yield_origin = bond_base_yield
-            
-            # 殖利率合理性限制
-            bond_yield_origin = max(0.5, min(8.0, bond_yield_origin))
-            
-            # 期末殖利率生成
-            yield_change = bond_yield_volatility * np.random.normal(0, np.sqrt(dt))
-            bond_yield_end = bond_yield_origin + yield_change
-            bond_yield_end = max(0.5, min(8.0, bond_yield_end))
-            
-            # 殖利率精度控制：小數點後4位
-            bond_yield_origin = round(bond_yield_origin, 4)
-            bond_yield_end = round(bond_yield_end, 4)
-            
-            # 債券價格計算（簡化公式）
-            bond_price_origin = round(100.0 / (1 + bond_yield_origin/100), 2)
-            bond_price_end = round(100.0 / (1 + bond_yield_end/100), 2)
+            spy_price_origins[period_idx] = spy_price_origin
+            spy_price_ends[period_idx] = spy_price_end
             
             # 添加市場類型標記
-            market_data_list.append({
-                'Period': period,
-                'Date_Origin': date_str,
-                'Date_End': end_date_str,
-                'SPY_Price_Origin': spy_price_origin,
-                'SPY_Price_End': spy_price_end,
-                'Bond_Yield_Origin': bond_yield_origin,
-                'Bond_Yield_End': bond_yield_end,
-                'Bond_Price_Origin': bond_price_origin,
-                'Bond_Price_End': bond_price_end,
-                'Market_Type': stock_price_data['market_type'],  # 新增：市場類型標記
-                'Data_Source': 'simulation'  # 新增：數據來源標記
-            })
+            market_types[period_idx] = stock_price_data['market_type']
             
             # 更新連續性追蹤變量
             previous_spy_price_end = spy_price_end
-            previous_bond_yield_end = bond_yield_end
             current_cycle_remaining -= 1
         
-        # 創建DataFrame
-        market_data = pd.DataFrame(market_data_list)
+        # 創建DataFrame（各欄已是定型陣列，直接引用不另行複製）
+        market_data = pd.DataFrame({
+            'Period': np.arange(1, total_periods + 1, dtype=np.int64),
+            'Date_Origin': date_origins,
+            'Date_End': date_ends,
+            'SPY_Price_Origin': spy_price_origins,
+            'SPY_Price_End': spy_price_ends,
+            'Bond_Yield_Origin': bond_yield_origins,
+            'Bond_Yield_End': bond_yield_ends,
+            'Bond_Price_Origin': bond_price_origins,
+            'Bond_Price_End': bond_price_ends,
+            'Market_Type': market_types,  # 新增：市場類型標記
+            'Data_Source': 'simulation'  # 新增：數據來源標記
+        }, copy=False)
         
         # 顯示模擬數據詳細資訊
         self._display_simulation_data_info(market_data)
@@ -1295,7 +1602,6 @@ class ResultsDisplayManager:
                 st.markdown("#### 📊 品質指標")
                 
                 # 計算數據品質指標
-                import numpy as np
                 if 'SPY_Price_Origin' in market_data.columns and 'SPY_Price_End' in market_data.columns:
                     price_changes = []
                     for i in range(len(market_data)):
@@ -1382,27 +1688,40 @@ class ResultsDisplayManager:
     
 
     
+    def _get_summary_rows(self) -> Dict[str, Dict[str, Any]]:
+        """以策略名稱索引的摘要列（計算時已建立則直接取用，否則同一份summary_df只建立一次）"""
+        if "summary_rows" in self.calculation_results:
+            return self.calculation_results["summary_rows"]
+        
+        summary_df = self.calculation_results["summary_df"]
+        
+        if self._summary_rows_source is not summary_df:
+            self._summary_rows = _index_summary_rows(summary_df)
+            self._summary_rows_source = summary_df
+        
+        return self._summary_rows
+    
     def _get_final_values(self) -> Optional[Dict[str, float]]:
         """獲取最終價值比較"""
         if not self.calculation_results:
             return None
         
-        summary_df = self.calculation_results["summary_df"]
+        summary_rows = self._get_summary_rows()
         
-        if len(summary_df) >= 2:
-            va_value = summary_df[summary_df["Strategy"] == "VA_Rebalance"]["Final_Value"].iloc[0]
-            dca_value = summary_df[summary_df["Strategy"] == "DCA"]["Final_Value"].iloc[0]
+        if "VA_Rebalance" in summary_rows and "DCA" in summary_rows:
+            va_value = summary_rows["VA_Rebalance"]["Final_Value"]
+            dca_value = summary_rows["DCA"]["Final_Value"]
             
             if va_value > dca_value:
-               return {
-                   "recommended": va_value,
-                   "difference": va_value - dca_value
-               }
+                return {
+                    "recommended": va_value,
+                    "difference": va_value - dca_value
+                }
             else:
-               return {
-                   "recommended": dca_value,
-                   "difference": dca_value - va_value
-               }
+                return {
+                    "recommended": dca_value,
+                    "difference": dca_value - va_value
+                }
         
         return None
     
@@ -1411,25 +1730,26 @@ class ResultsDisplayManager:
         if not self.calculation_results:
             return None
         
-        summary_df = self.calculation_results["summary_df"]
+        summary_rows = self._get_summary_rows()
         
-        if len(summary_df) >= 2:
-            va_return = summary_df[summary_df["Strategy"] == "VA_Rebalance"]["Annualized_Return"].iloc[0]
-            dca_return = summary_df[summary_df["Strategy"] == "DCA"]["Annualized_Return"].iloc[0]
+        if "VA_Rebalance" in summary_rows and "DCA" in summary_rows:
+            va_return = summary_rows["VA_Rebalance"]["Annualized_Return"]
+            dca_return = summary_rows["DCA"]["Annualized_Return"]
             
             if va_return > dca_return:
-               return {
-                   "recommended": va_return,
-                   "difference": va_return - dca_return
-               }
+                return {
+                    "recommended": va_return,
+                    "difference": va_return - dca_return
+                }
             else:
-               return {
-                   "recommended": dca_return,
-                   "difference": dca_return - va_return
-               }
+                return {
+                    "recommended": dca_return,
+                    "difference": dca_return - va_return
+                }
         
         return None
     
+    @_fragment
     def render_strategy_comparison_cards(self):
         """渲染策略對比卡片 - 3.3.2節實作"""
         st.markdown("### 🎯 策略詳細比較")
@@ -1449,42 +1769,40 @@ class ResultsDisplayManager:
     
     def _render_strategy_card(self, strategy_key: str):
         """渲染單個策略卡片"""
-        card_config = self.strategy_cards_config[strategy_key]
+        card = _STRATEGY_CARD_SPECS[strategy_key]
         
         # 獲取計算結果
         strategy_data = self._get_strategy_data(strategy_key)
         
         with st.container():
-            st.markdown(f"#### {card_config['title']}")
+            st.markdown(f"#### {card.title}")
             
             # 關鍵特色
-            st.markdown(f"**✨ {card_config['key_feature']}**")
+            st.markdown(f"**✨ {card.key_feature}**")
             
             # 核心指標
             if strategy_data:
-               # 使用垂直排列的指標，避免嵌套列
-               st.metric("最終價值", f"${strategy_data['final_value']:,.0f}")
-               st.metric("年化報酬", f"{strategy_data['annualized_return']:.2f}%")
+                # 使用垂直排列的指標，避免嵌套列
+                st.metric("最終價值", f"${strategy_data['final_value']:,.0f}")
+                st.metric("年化報酬", f"{strategy_data['annualized_return']:.2f}%")
             
             # 適合對象
-            st.markdown(f"**👥 適合對象：** {card_config['content']['suitability']}")
+            st.markdown(f"**👥 適合對象：** {card.suitability}")
             
             # 優缺點
             st.markdown("**✅ 優點：**")
-            for pro in card_config['pros']:
-               st.markdown(f"• {pro}")
+            for pro in card.pros:
+                st.markdown(f"• {pro}")
             
             st.markdown("**⚠️ 缺點：**")
-            for con in card_config['cons']:
-               st.markdown(f"• {con}")
+            for con in card.cons:
+                st.markdown(f"• {con}")
     
     def _get_strategy_data(self, strategy_key: str) -> Optional[Dict[str, float]]:
         """獲取策略數據"""
         if not self.calculation_results:
             return None
         
-        summary_df = self.calculation_results["summary_df"]
-        
         if strategy_key == "va_strategy":
             strategy_name = "VA_Rebalance"
         elif strategy_key == "dca_strategy":
@@ -1492,17 +1810,17 @@ class ResultsDisplayManager:
         else:
             return None
         
-        strategy_row = summary_df[summary_df["Strategy"] == strategy_name]
+        row = self._get_summary_rows().get(strategy_name)
         
-        if len(strategy_row) > 0:
-            row = strategy_row.iloc[0]
+        if row is not None:
             return {
-               "final_value": row["Final_Value"],
-               "annualized_return": row["Annualized_Return"]
+                "final_value": row["Final_Value"],
+                "annualized_return": row["Annualized_Return"]
             }
         
         return None
     
+    @_fragment
     def render_charts_display(self):
         """渲染圖表顯示 - 3.3.3節實作 - 擴展到5個標籤頁"""
         st.markdown("### 📈 視覺化分析")
@@ -1552,11 +1870,9 @@ class ResultsDisplayManager:
         
         # 使用第2章圖表視覺化模組的策略比較圖表
         try:
-            chart = create_strategy_comparison_chart(
-               va_rebalance_df=self.calculation_results["va_rebalance_df"],
-               va_nosell_df=None,  # 簡化版本不顯示NoSell策略
-               dca_df=self.calculation_results["dca_df"],
-               chart_type="cumulative_value"
+            chart = _cached_strategy_comparison_chart(
+                self.calculation_results["va_rebalance_df"],
+                self.calculation_results["dca_df"]
             )
             
             st.altair_chart(chart, use_container_width=True)
@@ -1586,19 +1902,19 @@ class ResultsDisplayManager:
             st.error(f"策略比較摘要表格生成錯誤: {str(e)}")
             # 降級顯示基本信息
             try:
-               final_values = self._get_final_values()
-               annualized_returns = self._get_annualized_returns()
+                final_values = self._get_final_values()
+                annualized_returns = self._get_annualized_returns()
                
-               if final_values and annualized_returns:
-                   col1, col2 = st.columns(2)
-                   with col1:
-                       st.metric("VA策略最終價值", f"${final_values.get('va_final_value', 0):,.0f}")
-                       st.metric("VA策略年化報酬", f"{annualized_returns.get('va_annualized_return', 0):.2f}%")
-                   with col2:
-                       st.metric("DCA策略最終價值", f"${final_values.get('dca_final_value', 0):,.0f}")
-                       st.metric("DCA策略年化報酬", f"{annualized_returns.get('dca_annualized_return', 0):.2f}%")
+                if final_values and annualized_returns:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.metric("VA策略最終價值", f"${final_values.get('va_final_value', 0):,.0f}")
+                        st.metric("VA策略年化報酬", f"{annualized_returns.get('va_annualized_return', 0):.2f}%")
+                    with col2:
+                        st.metric("DCA策略最終價值", f"${final_values.get('dca_final_value', 0):,.0f}")
+                        st.metric("DCA策略年化報酬", f"{annualized_returns.get('dca_annualized_return', 0):.2f}%")
             except:
-               st.warning("無法顯示策略比較摘要")
+                st.warning("無法顯示策略比較摘要")
 
     def _render_return_comparison_chart(self):
         """渲染報酬比較圖表 - 使用Altair符合需求文件"""
@@ -1611,13 +1927,7 @@ class ResultsDisplayManager:
         
         # 使用第2章圖表視覺化模組的柱狀圖
         try:
-            chart = create_bar_chart(
-               data_df=summary_df,
-               x_field="Annualized_Return",
-               y_field="Strategy",
-               color_field="Strategy",
-               title="年化報酬率比較"
-            )
+            chart = _cached_return_bar_chart(summary_df)
             
             st.altair_chart(chart, use_container_width=True)
             
@@ -1628,6 +1938,9 @@ class ResultsDisplayManager:
     
     def _render_risk_analysis_chart(self):
         """渲染風險分析圖表"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         st.markdown("**風險指標比較**")
         
         if not self.calculation_results:
@@ -1686,77 +1999,35 @@ class ResultsDisplayManager:
         with col1:
             st.markdown("##### 🎯 VA策略投資行為分析")
             try:
-               va_df = self.calculation_results["va_rebalance_df"]
-               va_chart = create_investment_flow_chart(va_df)
-               st.altair_chart(va_chart, use_container_width=True)
+                va_df = self.calculation_results["va_rebalance_df"]
+                st.vega_lite_chart(_cached_investment_flow_spec(va_df), use_container_width=True)
                
-               # VA策略說明
-               st.info("💡 **VA策略說明**：綠色表示買入，紅色表示賣出，灰色表示持有。VA策略會根據市場波動調整投資金額。")
+                # VA策略說明
+                st.info("💡 **VA策略說明**：綠色表示買入，紅色表示賣出，灰色表示持有。VA策略會根據市場波動調整投資金額。")
                
             except Exception as e:
-               st.error(f"VA投資流圖表生成錯誤: {str(e)}")
-               # 降級到簡單數據顯示
-               va_df = self.calculation_results["va_rebalance_df"]
-               st.dataframe(va_df[["Period", "Invested", "Cum_Value"]].head(10))
+                st.error(f"VA投資流圖表生成錯誤: {str(e)}")
+                # 降級到簡單數據顯示
+                va_df = self.calculation_results["va_rebalance_df"]
+                st.dataframe(va_df[["Period", "Invested", "Cum_Value"]].head(10))
         
         with col2:
             st.markdown("##### 💰 DCA策略投資行為分析")
             try:
-               dca_df = self.calculation_results["dca_df"]
-               
-               # 為DCA策略創建投資流圖表數據
-               dca_df_copy = dca_df.copy()
-               
-               # DCA策略使用Fixed_Investment欄位作為投資金額
-               if "Fixed_Investment" in dca_df_copy.columns:
-                   dca_df_copy["Invested"] = dca_df_copy["Fixed_Investment"]
-                   # DCA策略都是買入操作
-                   dca_df_copy["Investment_Type"] = "Buy"
-               else:
-                   # 降級處理：如果沒有Fixed_Investment欄位，使用計算方式
-                   if len(dca_df_copy) > 1:
-                       # 計算每期投資金額
-                       dca_df_copy["Invested"] = dca_df_copy["Cum_Inv"].diff().fillna(dca_df_copy["Cum_Inv"].iloc[0])
-                   else:
-                       dca_df_copy["Invested"] = dca_df_copy.get("Cum_Inv", 0)
-                   dca_df_copy["Investment_Type"] = "Buy"
-               
-               # 確保Period欄位存在
-               if "Period" not in dca_df_copy.columns:
-                   dca_df_copy["Period"] = range(len(dca_df_copy))
-               
-               # 創建DCA投資流圖表
-               dca_chart = alt.Chart(dca_df_copy).mark_bar().encode(
-                   x=alt.X("Period:Q", title="Period"),
-                   y=alt.Y("Invested:Q", title="Investment Amount ($)"),
-                   color=alt.Color(
-                       "Investment_Type:N",
-                       scale=alt.Scale(
-                           domain=["Buy"],
-                           range=["green"]
-                       ),
-                       title="Action"
-                   ),
-                   tooltip=["Period", "Invested", "Investment_Type"]
-               ).properties(
-                   title="DCA Strategy Investment Flow",
-                   width=400,
-                   height=300
-               )
-               
-               st.altair_chart(dca_chart, use_container_width=True)
+                dca_df = self.calculation_results["dca_df"]
+                st.vega_lite_chart(_cached_dca_flow_spec(dca_df), use_container_width=True)
                
-               # DCA策略說明
-               st.info("💡 **DCA策略說明**：綠色表示固定金額買入。DCA策略每期投入固定金額，不進行賣出操作。")
+                # DCA策略說明
+                st.info("💡 **DCA策略說明**：綠色表示固定金額買入。DCA策略每期投入固定金額，不進行賣出操作。")
                
             except Exception as e:
-               st.error(f"DCA投資流圖表生成錯誤: {str(e)}")
-               # 降級到簡單數據顯示
-               dca_df = self.calculation_results["dca_df"]
-               if "Fixed_Investment" in dca_df.columns:
-                   st.dataframe(dca_df[["Period", "Fixed_Investment", "Cum_Value"]].head(10))
-               else:
-                   st.dataframe(dca_df[["Period", "Cum_Inv", "Cum_Value"]].head(10))
+                st.error(f"DCA投資流圖表生成錯誤: {str(e)}")
+                # 降級到簡單數據顯示
+                dca_df = self.calculation_results["dca_df"]
+                if "Fixed_Investment" in dca_df.columns:
+                    st.dataframe(dca_df[["Period", "Fixed_Investment", "Cum_Value"]].head(10))
+                else:
+                    st.dataframe(dca_df[["Period", "Cum_Inv", "Cum_Value"]].head(10))
         
 
     
@@ -1773,29 +2044,28 @@ class ResultsDisplayManager:
             
             # 1. 優先從session_state獲取
             if 'stock_ratio' in st.session_state:
-               stock_ratio = st.session_state['stock_ratio']
-               # 如果是百分比形式（0-100），轉換為小數形式（0-1）
-               if stock_ratio > 1:
-                   stock_ratio = stock_ratio / 100
+                stock_ratio = st.session_state['stock_ratio']
+                # 如果是百分比形式（0-100），轉換為小數形式（0-1）
+                if stock_ratio > 1:
+                    stock_ratio = stock_ratio / 100
             
             # 2. 從計算結果的參數中獲取
             if stock_ratio is None and hasattr(self, 'last_parameters') and self.last_parameters:
-               stock_ratio = self.last_parameters.get('stock_ratio', 0.6)
-               if stock_ratio > 1:
-                   stock_ratio = stock_ratio / 100
+                stock_ratio = self.last_parameters.get('stock_ratio', 0.6)
+                if stock_ratio > 1:
+                    stock_ratio = stock_ratio / 100
             
             # 3. 使用預設值
             if stock_ratio is None:
-               stock_ratio = 0.6  # 預設60%股票，40%債券
+                stock_ratio = 0.6  # 預設60%股票，40%債券
             
             bond_ratio = 1 - stock_ratio
             
             # 驗證比例數據
             if stock_ratio < 0 or stock_ratio > 1 or bond_ratio < 0 or bond_ratio > 1:
-               raise ValueError(f"無效的資產配置比例: 股票={stock_ratio:.2%}, 債券={bond_ratio:.2%}")
+                raise ValueError(f"無效的資產配置比例: 股票={stock_ratio:.2%}, 債券={bond_ratio:.2%}")
             
-            pie_chart = create_allocation_pie_chart(stock_ratio, bond_ratio)
-            st.altair_chart(pie_chart, use_container_width=True)
+            st.vega_lite_chart(_cached_allocation_pie_spec(stock_ratio, bond_ratio), use_container_width=True)
             
             # 添加配置說明
             st.info(f"📊 **配置說明**：股票 {stock_ratio:.1%} | 債券 {bond_ratio:.1%}")
@@ -1803,25 +2073,25 @@ class ResultsDisplayManager:
             # 添加配置詳細信息
             col1, col2 = st.columns(2)
             with col1:
-               st.metric("股票配置", f"{stock_ratio:.1%}", help="投資於股票市場的比例")
+                st.metric("股票配置", f"{stock_ratio:.1%}", help="投資於股票市場的比例")
             with col2:
-               st.metric("債券配置", f"{bond_ratio:.1%}", help="投資於債券市場的比例")
+                st.metric("債券配置", f"{bond_ratio:.1%}", help="投資於債券市場的比例")
             
         except Exception as e:
             st.error(f"資產配置圖表錯誤: {str(e)}")
             # 降級到文字顯示
             try:
-               stock_ratio = st.session_state.get('stock_ratio', 60)
-               if stock_ratio > 1:
-                   stock_ratio = stock_ratio / 100
-               bond_ratio = 1 - stock_ratio
-               st.write(f"📊 **資產配置**")
-               st.write(f"• 股票比例: {stock_ratio:.1%}")
-               st.write(f"• 債券比例: {bond_ratio:.1%}")
+                stock_ratio = st.session_state.get('stock_ratio', 60)
+                if stock_ratio > 1:
+                    stock_ratio = stock_ratio / 100
+                bond_ratio = 1 - stock_ratio
+                st.write(f"📊 **資產配置**")
+                st.write(f"• 股票比例: {stock_ratio:.1%}")
+                st.write(f"• 債券比例: {bond_ratio:.1%}")
             except:
-               st.write("📊 **預設資產配置**")
-               st.write("• 股票比例: 60.0%")
-               st.write("• 債券比例: 40.0%")
+                st.write("📊 **預設資產配置**")
+                st.write("• 股票比例: 60.0%")
+                st.write("• 債券比例: 40.0%")
     
     def _render_drawdown_analysis_chart(self):
         """渲染回撤分析圖表 - 獨立標籤頁"""
@@ -1835,35 +2105,24 @@ class ResultsDisplayManager:
             va_df = self.calculation_results["va_rebalance_df"]
             dca_df = self.calculation_results["dca_df"]
             
-            # 創建VA策略回撤圖表
-            va_drawdown_chart = create_drawdown_chart(va_df, "VA策略")
-            
-            # 創建DCA策略回撤圖表
-            dca_drawdown_chart = create_drawdown_chart(dca_df, "DCA策略")
-            
-            # 垂直合併兩個圖表
-            combined_drawdown_chart = alt.vconcat(
-               va_drawdown_chart.properties(title="VA策略 回撤分析"),
-               dca_drawdown_chart.properties(title="DCA策略 回撤分析")
-            ).resolve_scale(x='independent', y='independent')
-            
-            st.altair_chart(combined_drawdown_chart, use_container_width=True)
+            # VA與DCA回撤圖表垂直合併（規格依計算結果快取）
+            st.vega_lite_chart(_cached_drawdown_spec(va_df, dca_df), use_container_width=True)
             
             # 添加回撤統計摘要
             st.markdown("##### 📊 回撤統計摘要")
             col1, col2 = st.columns(2)
             
             with col1:
-               # VA策略回撤統計
-               va_max_drawdown = va_df["Cum_Value"].expanding().max()
-               va_current_drawdown = (va_df["Cum_Value"] - va_max_drawdown) / va_max_drawdown
-               st.metric("VA策略最大回撤", f"{va_current_drawdown.min():.2%}", help="VA策略歷史最大回撤幅度")
+                # VA策略回撤統計
+                va_max_drawdown = va_df["Cum_Value"].expanding().max()
+                va_current_drawdown = (va_df["Cum_Value"] - va_max_drawdown) / va_max_drawdown
+                st.metric("VA策略最大回撤", f"{va_current_drawdown.min():.2%}", help="VA策略歷史最大回撤幅度")
             
             with col2:
-               # DCA策略回撤統計
-               dca_max_drawdown = dca_df["Cum_Value"].expanding().max()
-               dca_current_drawdown = (dca_df["Cum_Value"] - dca_max_drawdown) / dca_max_drawdown
-               st.metric("DCA策略最大回撤", f"{dca_current_drawdown.min():.2%}", help="DCA策略歷史最大回撤幅度")
+                # DCA策略回撤統計
+                dca_max_drawdown = dca_df["Cum_Value"].expanding().max()
+                dca_current_drawdown = (dca_df["Cum_Value"] - dca_max_drawdown) / dca_max_drawdown
+                st.metric("DCA策略最大回撤", f"{dca_current_drawdown.min():.2%}", help="DCA策略歷史最大回撤幅度")
             
         except Exception as e:
             st.error(f"回撤分析圖表錯誤: {str(e)}")
@@ -1890,7 +2149,7 @@ class ResultsDisplayManager:
         
         try:
             summary_df = self.calculation_results["summary_df"]
-            scatter_chart = create_risk_return_scatter(summary_df)
+            scatter_chart = _cached_risk_return_scatter(summary_df)
             st.altair_chart(scatter_chart, use_container_width=True)
             
             # 添加風險收益統計摘要
@@ -1898,15 +2157,15 @@ class ResultsDisplayManager:
             
             # 顯示每個策略的風險收益指標
             for _, row in summary_df.iterrows():
-               with st.expander(f"📈 {row['Strategy']} 策略詳細指標"):
-                   col1, col2, col3 = st.columns(3)
+                with st.expander(f"📈 {row['Strategy']} 策略詳細指標"):
+                    col1, col2, col3 = st.columns(3)
                    
-                   with col1:
-                       st.metric("年化報酬率", f"{row['Annualized_Return']:.2f}%")
-                   with col2:
-                       st.metric("波動率", f"{row['Volatility']:.2f}%")
-                   with col3:
-                       st.metric("夏普比率", f"{row['Sharpe_Ratio']:.2f}")
+                    with col1:
+                        st.metric("年化報酬率", f"{row['Annualized_Return']:.2f}%")
+                    with col2:
+                        st.metric("波動率", f"{row['Volatility']:.2f}%")
+                    with col3:
+                        st.metric("夏普比率", f"{row['Sharpe_Ratio']:.2f}")
             
         except Exception as e:
             st.error(f"風險收益散點圖錯誤: {str(e)}")
@@ -1918,6 +2177,8 @@ class ResultsDisplayManager:
     
     def _render_fallback_line_chart(self):
         """降級線圖 - 當Altair圖表失敗時使用"""
+        from ..models.chart_visualizer import create_line_chart
+        
         try:
             va_df = self.calculation_results["va_rebalance_df"]
             dca_df = self.calculation_results["dca_df"]
@@ -1958,53 +2219,56 @@ class ResultsDisplayManager:
             # 最終降級到數據表格
             st.dataframe(combined_df.pivot(index="Period", columns="Strategy", values="Cum_Value"))
     
+    @_fragment
     def render_data_tables_and_download(self):
         """渲染數據表格與下載 - 3.3.4節實作"""
         
         # 可展開的數據表格區域
         with st.expander("📊 詳細數據表格", expanded=False):
-            
-            if not self.calculation_results:
-               st.info("請設定投資參數後開始分析")
-               return
-            
+            self._render_data_table_selector()
+        
+        # CSV下載區域
+        st.markdown("### 💾 數據下載")
+        self._render_download_buttons()
+    
+    @_requires_results("請設定投資參數後開始分析")
+    def _render_data_table_selector(self):
+        """渲染詳細數據表格選擇器"""
+        # 展開器收合時內容仍會執行，表格格式化改由使用者開啟後才進行
+        if st.toggle("載入詳細數據", key="show_data_tables"):
             # 策略選擇器
             strategy_options = ["VA策略", "DCA策略", "比較摘要"]
             selected_strategy = st.selectbox(
-               "選擇要查看的數據",
-               strategy_options,
-               key="strategy_table_selector"
+                "選擇要查看的數據",
+                strategy_options,
+                key="strategy_table_selector"
             )
             
             # 渲染對應表格
             if selected_strategy == "VA策略":
-               self._render_va_strategy_table()
+                self._render_va_strategy_table()
             elif selected_strategy == "DCA策略":
-               self._render_dca_strategy_table()
+                self._render_dca_strategy_table()
             elif selected_strategy == "比較摘要":
-               self._render_summary_table()
-        
-        # CSV下載區域
-        st.markdown("### 💾 數據下載")
-        
-        if not self.calculation_results:
-            st.info("請設定投資參數後開始分析")
-            return
+                self._render_summary_table()
+    
+    @_requires_results("請設定投資參數後開始分析")
+    def _render_download_buttons(self):
+        """渲染CSV下載按鈕 - 直接使用快取的CSV位元組，不需先按準備按鈕"""
+        # 同一份計算結果固定使用同一個時間戳，下載按鈕的key與檔名在重跑間保持穩定
+        timestamp = st.session_state.setdefault("_export_ts", datetime.now().strftime("%Y%m%d_%H%M%S"))
         
         # 三按鈕布局
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if st.button("📥 VA策略數據", use_container_width=True, key="download_va_button"):
-               self._download_csv("va_strategy")
+            self._download_csv("va_strategy", "📥 VA策略數據", timestamp)
         
         with col2:
-            if st.button("📥 DCA策略數據", use_container_width=True, key="download_dca_button"):
-               self._download_csv("dca_strategy")
+            self._download_csv("dca_strategy", "📥 DCA策略數據", timestamp)
         
         with col3:
-            if st.button("📥 績效摘要", use_container_width=True, key="download_summary_button"):
-               self._download_csv("summary")
+            self._download_csv("summary", "📥 績效摘要", timestamp)
     
     def _render_va_strategy_table(self):
         """渲染VA策略表格 - 使用第2章VA_COLUMNS_ORDER"""
@@ -2013,8 +2277,8 @@ class ResultsDisplayManager:
         va_df = self.calculation_results["va_rebalance_df"]
         
         # 確保欄位順序符合第2章規格
-        display_columns = [col for col in VA_COLUMNS_ORDER if col in va_df.columns]
-        display_df = va_df[display_columns].copy()
+        display_columns = _ordered_columns(tuple(VA_COLUMNS_ORDER), tuple(va_df.columns))
+        display_df = va_df[list(display_columns)]
         
         # 應用格式化規則
         display_df = self._apply_formatting_rules(display_df, "VA")
@@ -2030,8 +2294,8 @@ class ResultsDisplayManager:
         dca_df = self.calculation_results["dca_df"]
         
         # 確保欄位順序符合第2章規格
-        display_columns = [col for col in DCA_COLUMNS_ORDER if col in dca_df.columns]
-        display_df = dca_df[display_columns].copy()
+        display_columns = _ordered_columns(tuple(DCA_COLUMNS_ORDER), tuple(dca_df.columns))
+        display_df = dca_df[list(display_columns)]
         
         # 應用格式化規則
         display_df = self._apply_formatting_rules(display_df, "DCA")
@@ -2052,28 +2316,11 @@ class ResultsDisplayManager:
         st.dataframe(display_df, use_container_width=True)
     
     def _apply_formatting_rules(self, df: pd.DataFrame, table_type: str) -> pd.DataFrame:
-        """應用格式化規則 - 遵循第2章PERCENTAGE_PRECISION_RULES"""
-        formatted_df = df.copy()
-        
-        # 應用百分比精度規則
-        for col in formatted_df.columns:
-            if col in PERCENTAGE_PRECISION_RULES:
-               precision = PERCENTAGE_PRECISION_RULES[col]
-               if formatted_df[col].dtype in ['float64', 'float32']:
-                   formatted_df[col] = formatted_df[col].round(precision)
-        
-        # 貨幣格式化
-        currency_columns = ["Cum_Value", "Cum_Inv", "Final_Value", "Total_Investment"]
-        for col in currency_columns:
-            if col in formatted_df.columns:
-               formatted_df[col] = formatted_df[col].apply(lambda x: f"${x:,.0f}" if pd.notna(x) else "")
-        
-        return formatted_df
+        """應用格式化規則 - 遵循第2章PERCENTAGE_PRECISION_RULES（結果依表格內容快取）"""
+        return _format_table(df, table_type)
     
-    def _download_csv(self, data_type: str):
-        """下載CSV文件"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
+    def _download_csv(self, data_type: str, label: str, timestamp: str):
+        """渲染CSV下載按鈕"""
         if data_type == "va_strategy":
             df = self.calculation_results["va_rebalance_df"]
             filename = f"投資策略比較_VA策略_{timestamp}.csv"
@@ -2086,18 +2333,18 @@ class ResultsDisplayManager:
         else:
             return
         
-        # 轉換為CSV
-        csv = df.to_csv(index=False, encoding='utf-8-sig')
+        # 轉換為CSV（依表格內容快取，直接以bytes交給下載按鈕）
+        csv = _serialize_csv(df)
         
         st.download_button(
-            label=f"下載 {filename}",
+            label=label,
             data=csv,
             file_name=filename,
             mime="text/csv",
-            key=f"download_{data_type}_{timestamp}"
+            use_container_width=True,
+            help=filename,
+            key=f"download_{data_type}_button"
         )
-        
-        st.success(f"✅ {filename} 準備就緒")
     
     def render_mobile_optimized_results(self, parameters: Dict[str, Any]):
         """
@@ -2124,77 +2371,65 @@ class ResultsDisplayManager:
         """渲染移動端摘要卡片 - 垂直堆疊"""
         st.markdown("#### 📊 策略比較結果")
         
+        context = self._build_mobile_metric_context()
+        if context is None:
+            return
+        
         # 推薦策略卡片
-        self._render_mobile_metric_card("recommended_strategy")
+        self._render_mobile_metric_card("recommended_strategy", context)
         
         # 最終價值卡片
-        self._render_mobile_metric_card("expected_final_value")
+        self._render_mobile_metric_card("expected_final_value", context)
         
         # 年化報酬率卡片
-        self._render_mobile_metric_card("annualized_return")
+        self._render_mobile_metric_card("annualized_return", context)
     
-    def _render_mobile_metric_card(self, metric_type: str):
-        """渲染移動端指標卡片"""
-        # 獲取最終值和年化報酬率
-        final_values = self._get_final_values()
-        annualized_returns = self._get_annualized_returns()
+    def _build_mobile_metric_context(self) -> Optional[MetricContext]:
+        """一次取出兩種策略的最終價值與年化報酬率並決定勝出策略"""
+        if not self.calculation_results:
+            return None
         
-        if not final_values or not annualized_returns:
-            return
+        summary_rows = self._get_summary_rows()
+        va_row = summary_rows.get("VA_Rebalance")
+        dca_row = summary_rows.get("DCA")
         
-        va_value = final_values.get('va_final_value', 0)
-        dca_value = final_values.get('dca_final_value', 0)
-        va_return = annualized_returns.get('va_annualized_return', 0)
-        dca_return = annualized_returns.get('dca_annualized_return', 0)
+        if va_row is None or dca_row is None:
+            return None
         
-        # 渲染不同類型的指標卡片
-        if metric_type == "recommended_strategy":
-            if va_return > dca_return:
-               st.metric(
-                   label="🎯 推薦策略",
-                   value="定期定值 (VA)",
-                   delta=f"優勢 {va_return - dca_return:.1f}%",
-                   help="基於年化報酬率的推薦"
-               )
-            else:
-               st.metric(
-                   label="🎯 推薦策略",
-                   value="定期定額 (DCA)",
-                   delta=f"優勢 {dca_return - va_return:.1f}%",
-                   help="基於年化報酬率的推薦"
-               )
-               
-        elif metric_type == "expected_final_value":
-            if va_value > dca_value:
-               st.metric(
-                   label="💰 預期最終價值",
-                   value=f"${va_value:,.0f}",
-                   delta=f"+${va_value - dca_value:,.0f}",
-                   help="VA策略預期最終價值較高"
-               )
-            else:
-               st.metric(
-                   label="💰 預期最終價值",
-                   value=f"${dca_value:,.0f}",
-                   delta=f"+${dca_value - va_value:,.0f}",
-                   help="DCA策略預期最終價值較高"
-               )
-               
-        elif metric_type == "annualized_return":
-            if va_return > dca_return:
-               st.metric(
-                   label="📈 年化報酬率",
-                   value=f"{va_return:.1f}%",
-                   delta=f"+{va_return - dca_return:.1f}%",
-                   help="VA策略年化報酬率較高"
-               )
-            else:
-               st.metric(
-                   label="📈 年化報酬率",
-                   value=f"{dca_return:.1f}%",
-                   delta=f"+{dca_return - va_return:.1f}%",
-                   help="DCA策略年化報酬率較高"
-               )
+        va_value, dca_value = va_row["Final_Value"], dca_row["Final_Value"]
+        va_return, dca_return = va_row["Annualized_Return"], dca_row["Annualized_Return"]
+        
+        return MetricContext(
+            winner_return="va" if va_return > dca_return else "dca",
+            winner_value="va" if va_value > dca_value else "dca",
+            va_value=va_value,
+            dca_value=dca_value,
+            va_return=va_return,
+            dca_return=dca_return
+        )
+    
+    def _render_mobile_metric_card(self, metric_type: str, context: MetricContext):
+        """渲染移動端指標卡片"""
+        spec = _MOBILE_METRIC_CARDS.get(metric_type)
+        if spec is None:
+            return
+        
+        # 勝出策略已於context預先決定，此處只取值與格式化
+        label, basis, value_fn, delta_fn, help_fn = spec
+        if basis == "return":
+            winner = context.winner_return
+            va_metric, dca_metric = context.va_return, context.dca_return
+        else:
+            winner = context.winner_value
+            va_metric, dca_metric = context.va_value, context.dca_value
+        best, other = (va_metric, dca_metric) if winner == "va" else (dca_metric, va_metric)
+        
+        st.metric(
+            label=label,
+            value=value_fn(winner, best),
+            delta=delta_fn(best - other),
+            help=help_fn(winner)
+        )
     
     def _render_mobile_chart(self):
         """渲染移動端圖表 - 簡化版"""
@@ -2211,44 +2446,8 @@ class ResultsDisplayManager:
             st.error("計算數據不完整")
             return
         
-        # 創建簡化的時間序列圖
-        fig = go.Figure()
-        
-        # VA線條
-        fig.add_trace(go.Scatter(
-            x=va_df.index,
-            y=va_df['Cum_Value'],
-            mode='lines',
-            name='🎯 定期定值 (VA)',
-            line=dict(color='#3b82f6', width=3)
-        ))
-        
-        # DCA線條
-        fig.add_trace(go.Scatter(
-            x=dca_df.index,
-            y=dca_df['Cum_Value'],
-            mode='lines',
-            name='💰 定期定額 (DCA)',
-            line=dict(color='#10b981', width=3)
-        ))
-        
-        # 移動端優化設定
-        fig.update_layout(
-            height=300,  # 較小高度
-            margin=dict(l=20, r=20, t=40, b=20),
-            font=dict(size=12),
-            legend=dict(
-               orientation="h",
-               yanchor="bottom",
-               y=1.02,
-               xanchor="right",
-               x=1
-            ),
-            xaxis_title="投資期數",
-            yaxis_title="投資價值 ($)",
-            hovermode='x unified'
-        )
-        
+        # 移動端保留plotly觸控互動，圖表依計算結果快取
+        fig = _cached_mobile_growth_figure(va_df, dca_df)
         st.plotly_chart(fig, use_container_width=True, key="mobile_growth_chart")
     
     def _render_mobile_comparison_table(self):
@@ -2258,36 +2457,35 @@ class ResultsDisplayManager:
         if not self.calculation_results:
             return
         
-        # 獲取數據
-        final_values = self._get_final_values()
-        annualized_returns = self._get_annualized_returns()
+        # 獲取數據（與摘要卡片同樣取自已索引的摘要列）
+        summary_rows = self._get_summary_rows()
+        va_row = summary_rows.get("VA_Rebalance")
+        dca_row = summary_rows.get("DCA")
         
-        if not final_values or not annualized_returns:
+        if va_row is None or dca_row is None:
             return
         
+        # 報酬倍數以陣列一次計算與格式化
+        finals = np.array([va_row["Final_Value"], dca_row["Final_Value"]], dtype=float)
+        investments = np.maximum(np.array([va_row["Total_Investment"], dca_row["Total_Investment"]], dtype=float), 1)
+        multiple_labels = np.char.add(np.char.mod("%.1f", finals / investments), "x").tolist()
+        
         # 創建簡化的比較表格
         comparison_data = {
             "指標": ["💰 最終價值", "📈 年化報酬率", "💸 總投入", "📊 報酬倍數"],
             "🎯 定期定值 (VA)": [
-               f"${final_values.get('va_final_value', 0):,.0f}",
-               f"{annualized_returns.get('va_annualized_return', 0):.1f}%",
-               f"${final_values.get('va_total_investment', 0):,.0f}",
-               f"{final_values.get('va_final_value', 0) / max(final_values.get('va_total_investment', 1), 1):.1f}x"
+                f"${va_row['Final_Value']:,.0f}",
+                f"{va_row['Annualized_Return']:.1f}%",
+                f"${va_row['Total_Investment']:,.0f}",
+                multiple_labels[0]
             ],
             "💰 定期定額 (DCA)": [
-               f"${final_values.get('dca_final_value', 0):,.0f}",
-               f"{annualized_returns.get('dca_annualized_return', 0):.1f}%",
-               f"${final_values.get('dca_total_investment', 0):,.0f}",
-               f"{final_values.get('dca_final_value', 0) / max(final_values.get('dca_total_investment', 1), 1):.1f}x"
+                f"${dca_row['Final_Value']:,.0f}",
+                f"{dca_row['Annualized_Return']:.1f}%",
+                f"${dca_row['Total_Investment']:,.0f}",
+                multiple_labels[1]
             ]
         }
         
-        df = pd.DataFrame(comparison_data)
-        
-        # 使用觸控友善的表格顯示
-        st.dataframe(
-            df,
-            use_container_width=True,
-            hide_index=True,
-            height=200
-        )
\ No newline at end of file
+        # 4x3的小表直接以dict渲染，省去DataFrame建構
+        st.table(comparison_data)
\ No newline at end of file
@@ -587,25 +587,28 @@ class SmartRecommendationEngine:
         if "summary_df" not in calculation_results:
             return {"performance_difference": 0, "better_strategy": "neutral"}
         
-        summary_df = calculation_results["summary_df"]
-        
-        if len(summary_df) >= 2:
-            va_row = summary_df[summary_df["Strategy"] == "VA_Rebalance"]
-            dca_row = summary_df[summary_df["Strategy"] == "DCA"]
+        # 優先使用計算時已建立的策略列字典
+        summary_rows = calculation_results.get("summary_rows")
+        if summary_rows is None:
+            summary_df = calculation_results["summary_df"]
+            summary_rows = summary_df.drop_duplicates("Strategy").set_index("Strategy").to_dict(orient="index")
+        
+        va_row = summary_rows.get("VA_Rebalance")
+        dca_row = summary_rows.get("DCA")
+        
+        if va_row is not None and dca_row is not None:
+            va_return = va_row["Annualized_Return"]
+            dca_return = dca_row["Annualized_Return"]
+            
+            performance_diff = abs(va_return - dca_return)
+            better_strategy = "VA" if va_return > dca_return else "DCA"
             
-            if len(va_row) > 0 and len(dca_row) > 0:
-                va_return = va_row["Annualized_Return"].iloc[0]
-                dca_return = dca_row["Annualized_Return"].iloc[0]
-                
-                performance_diff = abs(va_return - dca_return)
-                better_strategy = "VA" if va_return > dca_return else "DCA"
-                
-                return {
-                    "performance_difference": performance_diff,
-                    "better_strategy": better_strategy,
-                    "va_return": va_return,
-                    "dca_return": dca_return
-                }
+            return {
+                "performance_difference": performance_diff,
+                "better_strategy": better_strategy,
+                "va_return": va_return,
+                "dca_return": dca_return
+            }
         
         return {"performance_difference": 0, "better_strategy": "neutral"}
     
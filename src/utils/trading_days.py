@@ -4,9 +4,11 @@
 """
 
 import holidays
+import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -228,6 +230,52 @@ def calculate_period_end_date(base_start_date: datetime, frequency: str, period_
     return end_date
 
 
+def _months_per_period(frequency: str) -> int:
+    """投資頻率對應的每期月數（未知頻率預設為年度）"""
+    frequency_lower = frequency.lower()
+    
+    if frequency_lower in ['monthly', 'month']:
+        return 1
+    elif frequency_lower in ['quarterly', 'quarter']:
+        return 3
+    elif frequency_lower in ['semi-annually', 'semi_annually', 'semiannually']:
+        return 6
+    return 12
+
+
+def _shift_months(dates: np.ndarray, months) -> np.ndarray:
+    """datetime64[D]陣列逐項加上月數；日期超過目標月份天數時取該月最後一天（同relativedelta）"""
+    month_starts = dates.astype('datetime64[M]')
+    day_offsets = dates - month_starts.astype('datetime64[D]')
+    target_months = month_starts + months
+    month_lengths = (target_months + 1).astype('datetime64[D]') - target_months.astype('datetime64[D]')
+    return target_months.astype('datetime64[D]') + np.minimum(day_offsets, month_lengths - np.timedelta64(1, 'D'))
+
+
+def calculate_period_dates(base_start_date: datetime, frequency: str, total_periods: int) -> Tuple[pd.DatetimeIndex, pd.DatetimeIndex]:
+    """
+    一次計算所有期間的期初與期末日期
+    
+    結果與逐期呼叫 calculate_period_start_date / calculate_period_end_date 相同（僅保留日期部分），
+    以陣列運算取代每期的 relativedelta 計算。
+    
+    Args:
+        base_start_date: 第1期起始日期 (例如: 2025-01-01)
+        frequency: 投資頻率 ('monthly', 'quarterly', 'semi-annually', 'annually')
+        total_periods: 總期數
+        
+    Returns:
+        tuple: (各期起始日期, 各期結束日期)
+    """
+    months_per_period = _months_per_period(frequency)
+    base_dates = np.full(total_periods, np.datetime64(pd.Timestamp(base_start_date).date(), 'D'))
+    
+    period_starts = _shift_months(base_dates, np.arange(total_periods) * months_per_period)
+    period_ends = _shift_months(period_starts, months_per_period) - np.timedelta64(1, 'D')
+    
+    return pd.DatetimeIndex(period_starts), pd.DatetimeIndex(period_ends)
+
+
 def generate_simulation_timeline(investment_years: int, frequency: str, user_start_date=None) -> List[Dict]:
     """
     生成完整模擬數據時間軸，包含交易日調整
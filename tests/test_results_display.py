@@ -0,0 +1,182 @@
+"""
+結果展示模組測試腳本
+
+測試結果展示管理器的數據處理輔助函數與備用模擬數據生成
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import io
+import unittest
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from unittest.mock import patch
+import streamlit as st
+from src.ui.results_display import (
+    ResultsDisplayManager, _sorted_observations, _nearest_observations, _serialize_csv
+)
+
+class TestNearestObservations(unittest.TestCase):
+    """二分搜尋最近觀測日期與逐筆掃描結果一致性測試"""
+    
+    def setUp(self):
+        """測試前準備"""
+        self.dates, self.values = _sorted_observations(
+            ['2024-01-10', '2024-01-02', '2024-01-06'],  # API回傳順序不保證遞增
+            [103.0, 101.0, 102.0]
+        )
+    
+    @staticmethod
+    def _scan_nearest(date_strs, target):
+        """原本的逐筆掃描：取相差天數最小者，相同時取較早日期"""
+        closest = min(sorted(date_strs), key=lambda x: abs((datetime.strptime(x, '%Y-%m-%d') - target).days))
+        return closest, abs((datetime.strptime(closest, '%Y-%m-%d') - target).days)
+    
+    def _nearest(self, *targets):
+        return _nearest_observations(self.dates, np.array(targets, dtype='datetime64[D]'))
+    
+    def test_sorted_observations(self):
+        """觀測資料依日期排序，數值跟隨日期"""
+        self.assertEqual([str(d) for d in self.dates], ['2024-01-02', '2024-01-06', '2024-01-10'])
+        self.assertEqual(self.values.tolist(), [101.0, 102.0, 103.0])
+    
+    def test_before_first_date(self):
+        """目標早於第一筆觀測時取第一筆"""
+        idx, diff = self._nearest('2023-12-25')
+        self.assertEqual(idx.tolist(), [0])
+        self.assertEqual(diff.tolist(), [8])
+    
+    def test_after_last_date(self):
+        """目標晚於最後一筆觀測時取最後一筆"""
+        idx, diff = self._nearest('2024-02-09')
+        self.assertEqual(idx.tolist(), [2])
+        self.assertEqual(diff.tolist(), [30])
+    
+    def test_exact_match_and_tie(self):
+        """完全相同日期相差0天；前後距離相同時取較早日期"""
+        idx, diff = self._nearest('2024-01-06', '2024-01-04', '2024-01-08', '2024-01-09')
+        self.assertEqual(idx.tolist(), [1, 0, 1, 2])
+        self.assertEqual(diff.tolist(), [0, 2, 2, 1])
+    
+    def test_empty_observations(self):
+        """無觀測資料時回傳全零陣列"""
+        dates, _ = _sorted_observations([], [])
+        idx, diff = _nearest_observations(dates, np.array(['2024-01-01'], dtype='datetime64[D]'))
+        self.assertEqual(idx.tolist(), [0])
+        self.assertEqual(diff.tolist(), [0])
+    
+    def test_matches_linear_scan(self):
+        """隨機日期下與逐筆掃描結果相同"""
+        rng = np.random.default_rng(7)
+        base = np.datetime64('2020-01-01')
+        
+        for _ in range(50):
+            offsets = rng.choice(2000, size=int(rng.integers(1, 40)), replace=False)
+            date_strs = [str(base + int(offset)) for offset in offsets]
+            dates, _ = _sorted_observations(date_strs, np.zeros(len(date_strs)))
+            targets = base + rng.integers(-100, 2100, size=20)
+            
+            idx, diff = _nearest_observations(dates, targets)
+            
+            for target, i, d in zip(targets, idx, diff):
+                expected_date, expected_diff = self._scan_nearest(
+                    date_strs, datetime.strptime(str(target), '%Y-%m-%d')
+                )
+                self.assertEqual(str(dates[i]), expected_date)
+                self.assertEqual(int(d), expected_diff)
+
+class TestSerializeCsv(unittest.TestCase):
+    """CSV匯出位元組測試"""
+    
+    def setUp(self):
+        """測試前準備"""
+        self.df = pd.DataFrame({
+            "Strategy": ["VA_Rebalance", "DCA"],
+            "策略說明": ["定期定值", "定期定額"],
+            "Final_Value": [123456.78, np.nan],
+            "Period": [1, 2]
+        })
+    
+    def test_starts_with_utf8_bom(self):
+        """輸出以UTF-8 BOM開頭，且只有一個BOM"""
+        csv_bytes = _serialize_csv(self.df)
+        
+        self.assertTrue(csv_bytes.startswith(b'\xef\xbb\xbf'))
+        self.assertFalse(csv_bytes[3:].startswith(b'\xef\xbb\xbf'))
+    
+    def test_matches_utf8_sig_export(self):
+        """與to_csv(encoding='utf-8-sig')輸出相同，換行固定為LF"""
+        expected = io.BytesIO()
+        self.df.to_csv(expected, index=False, encoding='utf-8-sig', lineterminator='\n')
+        
+        csv_bytes = _serialize_csv(self.df)
+        
+        self.assertEqual(csv_bytes, expected.getvalue())
+        self.assertNotIn(b'\r\n', csv_bytes)
+    
+    def test_round_trip(self):
+        """以utf-8-sig讀回後內容與原表相同"""
+        restored = pd.read_csv(io.BytesIO(_serialize_csv(self.df)), encoding='utf-8-sig')
+        
+        self.assertEqual(list(restored.columns), list(self.df.columns))
+        pd.testing.assert_frame_equal(restored, self.df, check_dtype=False)
+
+class _SessionState(dict):
+    """以屬性與字典兩種方式存取的簡易session_state替身"""
+    
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+    
+    def __setattr__(self, key, value):
+        self[key] = value
+
+class TestFallbackDataRandomStream(unittest.TestCase):
+    """備用模擬數據的隨機序列測試（單一Generator取代逐期重設種子）"""
+    
+    PARAMETERS = {
+        "investment_periods": 5,
+        "investment_frequency": "quarterly",
+        "start_date": datetime(2020, 1, 1)
+    }
+    
+    def _generate(self, seed):
+        with patch.object(st, "session_state", _SessionState(custom_simulation_seed=seed)):
+            return ResultsDisplayManager()._generate_fallback_data(self.PARAMETERS)
+    
+    def test_same_seed_reproducible(self):
+        """相同種子產生完全相同的模擬數據"""
+        pd.testing.assert_frame_equal(self._generate(123), self._generate(123))
+    
+    def test_different_seed_changes_prices(self):
+        """不同種子產生不同的價格路徑"""
+        first, second = self._generate(123), self._generate(456)
+        
+        self.assertFalse(np.array_equal(first["SPY_Price_End"].to_numpy(), second["SPY_Price_End"].to_numpy()))
+    
+    def test_global_random_state_untouched(self):
+        """生成過程不改變numpy全域隨機狀態"""
+        np.random.seed(2024)
+        expected = np.random.random(3)
+        
+        np.random.seed(2024)
+        self._generate(123)
+        
+        np.testing.assert_array_equal(np.random.random(3), expected)
+    
+    def test_output_shape(self):
+        """期數與欄位符合規格，期間編號自1起連續"""
+        df = self._generate(123)
+        
+        self.assertEqual(len(df), 20)  # 5年 x 每年4季
+        self.assertEqual(df["Period"].tolist(), list(range(1, 21)))
+        self.assertTrue((df["SPY_Price_End"] > 0).all())
+        self.assertTrue(df["Bond_Yield_End"].between(0.5, 8.0).all())
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,61 @@
+"""
+交易日工具模組測試腳本
+
+測試向量化期間日期計算與逐期計算函數的一致性
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import unittest
+from datetime import datetime
+from src.utils.trading_days import (
+    calculate_period_dates, calculate_period_start_date, calculate_period_end_date
+)
+
+class TestCalculatePeriodDates(unittest.TestCase):
+    """向量化期間日期與逐期計算結果一致性測試"""
+    
+    FREQUENCIES = ['monthly', 'quarterly', 'semi-annually', 'annually', 'unknown']
+    BASE_DATES = [
+        datetime(2025, 1, 1),
+        datetime(2024, 1, 31),   # 月底起始，後續月份天數不足時取月底
+        datetime(2024, 2, 29),   # 閏年2月29日
+        datetime(2023, 8, 31),
+        datetime(2020, 11, 30),
+    ]
+    
+    def test_matches_scalar_functions(self):
+        """各頻率、各起始日期的期初與期末日期與逐期函數相同"""
+        total_periods = 40
+        
+        for frequency in self.FREQUENCIES:
+            for base_date in self.BASE_DATES:
+                with self.subTest(frequency=frequency, base_date=base_date):
+                    starts, ends = calculate_period_dates(base_date, frequency, total_periods)
+                    
+                    expected_starts = [calculate_period_start_date(base_date, frequency, period).date()
+                                       for period in range(1, total_periods + 1)]
+                    expected_ends = [calculate_period_end_date(base_date, frequency, period).date()
+                                     for period in range(1, total_periods + 1)]
+                    
+                    self.assertEqual([d.date() for d in starts], expected_starts)
+                    self.assertEqual([d.date() for d in ends], expected_ends)
+    
+    def test_time_component_ignored(self):
+        """起始日期含時間時只保留日期部分"""
+        starts, ends = calculate_period_dates(datetime(2025, 3, 15, 13, 45), 'monthly', 2)
+        
+        self.assertEqual(str(starts[0].date()), '2025-03-15')
+        self.assertEqual(str(ends[1].date()), '2025-05-14')
+    
+    def test_zero_periods(self):
+        """總期數為0時回傳空索引"""
+        starts, ends = calculate_period_dates(datetime(2025, 1, 1), 'monthly', 0)
+        
+        self.assertEqual(len(starts), 0)
+        self.assertEqual(len(ends), 0)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)